@@ -5,7 +5,6 @@
 # compatible open source license.
 
 import os
-import struct
 from abc import ABC, ABCMeta, abstractmethod
 from enum import Enum
 from typing import cast
@@ -85,22 +84,54 @@ def get_data_set(data_set_format: str, path: str, context: Context):
     raise ConfigurationError("Invalid data set format")
 
 
+# Every client of a task gets its own data set instance (with its own read position) but they share the underlying file
+# handle. Handles are reference-counted and closed as soon as the last data set that reads from them is released. The file
+# identity is part of the key so we never serve a stale handle when a file is replaced.
+_hdf5_files = {}
+
+
+def _acquire_hdf5_file(key: tuple) -> h5py.File:
+    if key not in _hdf5_files:
+        _hdf5_files[key] = [h5py.File(key[0], "r"), 0]
+    entry = _hdf5_files[key]
+    entry[1] += 1
+    return entry[0]
+
+
+def _release_hdf5_file(key: tuple):
+    entry = _hdf5_files[key]
+    entry[1] -= 1
+    if entry[1] == 0:
+        del _hdf5_files[key]
+        entry[0].close()
+
+
 class HDF5DataSet(DataSet):
     """ Data-set format corresponding to `ANN Benchmarks
     <https://github.com/erikbern/ann-benchmarks#data-sets>`_
     """
 
     FORMAT_NAME = "hdf5"
+    # Every slice of a h5py data set goes through the HDF5 library (and potentially decompresses a whole chunk), which
+    # dominates the cost of small reads, e.g. one query vector at a time. Hence, we read ahead at least this many bytes
+    # in one contiguous slice and serve subsequent reads from memory.
+    READ_AHEAD_BYTES = 1024 * 1024
 
     def __init__(self, dataset_path: str, context: Context):
         self.dataset_path = dataset_path
         self.context = self.parse_context(context)
         self.current = self.BEGINNING
+        self.file_key = None
         self.data = None
+        self.buffer = None
+        self.buffer_start = self.BEGINNING
+        self.buffer_end = self.BEGINNING
 
     def _load(self):
         if self.data is None:
-            file = h5py.File(self.dataset_path)
+            stat = os.stat(self.dataset_path)
+            self.file_key = (self.dataset_path, stat.st_ino, stat.st_mtime_ns)
+            file = _acquire_hdf5_file(self.file_key)
             self.data = cast(h5py.Dataset, file[self.context])
 
     def read(self, chunk_size: int):
@@ -113,10 +144,27 @@ class HDF5DataSet(DataSet):
         if end_offset > self.size():
             end_offset = self.size()
 
-        vectors = cast(np.ndarray, self.data[self.current:end_offset])
+        if self.current < self.buffer_start or end_offset > self.buffer_end:
+            self._fill_buffer(self.current, end_offset)
+        vectors = self.buffer[self.current - self.buffer_start:end_offset - self.buffer_start]
         self.current = end_offset
         return vectors
 
+    def _fill_buffer(self, start: int, end: int):
+        row_size = self.data.dtype.itemsize * int(np.prod(self.data.shape[1:]))
+        read_ahead_rows = self.READ_AHEAD_BYTES // max(row_size, 1)
+        if self.data.chunks:
+            # align to whole chunks so no chunk needs to be decompressed twice
+            chunk_rows = self.data.chunks[0]
+            start -= start % chunk_rows
+            rows = max(end - start, read_ahead_rows)
+            rows = -(-rows // chunk_rows) * chunk_rows
+        else:
+            rows = max(end - start, read_ahead_rows)
+        self.buffer_start = start
+        self.buffer_end = min(start + rows, self.size())
+        self.buffer = cast(np.ndarray, self.data[self.buffer_start:self.buffer_end])
+
     def seek(self, offset: int):
         if offset < self.BEGINNING:
             raise Exception("Offset must be greater than or equal to 0")
@@ -134,6 +182,21 @@ class HDF5DataSet(DataSet):
     def reset(self):
         self.current = self.BEGINNING
 
+    def close(self):
+        """
+        Releases the file handle. The data set is loaded again on the next access.
+        """
+        if self.file_key is not None:
+            self.data = None
+            self.buffer = None
+            self.buffer_start = self.BEGINNING
+            self.buffer_end = self.BEGINNING
+            _release_hdf5_file(self.file_key)
+            self.file_key = None
+
+    def __del__(self):
+        self.close()
+
     # pylint: disable=R0911
     @staticmethod
     def parse_context(context: Context) -> str:
@@ -185,7 +248,7 @@ class BigANNDataSet(DataSet):
         self.rows = int.from_bytes(self.file.read(4), "little")
         self.row_length = int.from_bytes(self.file.read(4), "little")
         self.bytes_per_num = self._get_data_size()
-        self.reader = self._value_reader()
+        self.dtype = self._value_dtype()
 
     def _load(self):
         # load file if it is not loaded yet
@@ -202,9 +265,10 @@ class BigANNDataSet(DataSet):
         if end_offset > self.size():
             end_offset = self.size()
 
-        vectors = np.asarray(
-            [self._read_vector() for _ in range(end_offset - self.current)]
-        )
+        # decode the whole chunk with one read instead of one read per value
+        count = (end_offset - self.current) * self.row_length
+        values = np.frombuffer(self.file.read(count * self.bytes_per_num), dtype=self.dtype, count=count)
+        vectors = values.reshape(-1, self.row_length).astype(self.VALUE_TYPE)
         self.current = end_offset
         return vectors
 
@@ -225,9 +289,6 @@ class BigANNDataSet(DataSet):
         self.file.seek(bytes_offset)
         self.current = offset
 
-    def _read_vector(self):
-        return np.asarray([self.reader(self.file) for _ in range(self.row_length)])
-
     def size(self):
         # load file first before return size
         self._load()
@@ -265,12 +326,12 @@ class BigANNDataSet(DataSet):
         return self.get_data_size(ext)
 
     @abstractmethod
-    def _get_value_reader(self, extension):
-        """Return value reader based on extension"""
+    def _get_value_dtype(self, extension):
+        """Return numpy dtype of stored values based on extension"""
 
-    def _value_reader(self):
+    def _value_dtype(self):
         ext = self._get_extension()
-        return self._get_value_reader(ext)
+        return self._get_value_dtype(ext)
 
 
 class BigANNVectorDataSet(BigANNDataSet):
@@ -287,6 +348,8 @@ class BigANNVectorDataSet(BigANNDataSet):
     BYTES_PER_U8INT = 1
     BYTES_PER_FLOAT = 4
 
+    VALUE_TYPE = np.float32
+
     def _init_internal_params(self):
         super()._init_internal_params()
         if (self.num_bytes - BigANNDataSet.DATA_SET_HEADER_LENGTH) != (
@@ -306,12 +369,12 @@ class BigANNVectorDataSet(BigANNDataSet):
 
         return None
 
-    def _get_value_reader(self, extension):
+    def _get_value_dtype(self, extension):
         if extension == BigANNVectorDataSet.U8BIN_EXTENSION:
-            return lambda file: float(int.from_bytes(file.read(BigANNVectorDataSet.BYTES_PER_U8INT), "little"))
+            return np.dtype('<u1')
 
         if extension == BigANNVectorDataSet.FBIN_EXTENSION:
-            return lambda file: struct.unpack('<f', file.read(BigANNVectorDataSet.BYTES_PER_FLOAT))
+            return np.dtype('<f4')
 
         return None
 
@@ -325,6 +388,8 @@ class BigANNGroundTruthDataSet(BigANNDataSet):
 
     BYTES_PER_UNSIGNED_INT32 = 4
 
+    VALUE_TYPE = np.int64
+
     def _init_internal_params(self):
         super()._init_internal_params()
         # The ground truth binary files consist of the following information:
@@ -342,9 +407,8 @@ class BigANNGroundTruthDataSet(BigANNDataSet):
     def get_data_size(self, extension):
         return BigANNGroundTruthDataSet.BYTES_PER_UNSIGNED_INT32
 
-    def _get_value_reader(self, extension):
-        return lambda file: int.from_bytes(
-            file.read(BigANNGroundTruthDataSet.BYTES_PER_UNSIGNED_INT32), "little")
+    def _get_value_dtype(self, extension):
+        return np.dtype('<u4')
 
 
 def create_big_ann_dataset(file_path: str):
@@ -23,7 +23,9 @@
 # under the License.
 
 import bz2
+import collections
 import gzip
+import itertools
 import logging
 import os
 import mmap
@@ -120,14 +122,8 @@ class MmapSource:
         return self.mm.readline()
 
     def readlines(self, num_lines):
-        lines = []
-        mm = self.mm
-        for _ in range(num_lines):
-            line = mm.readline()
-            if line == b"":
-                break
-            lines.append(line)
-        return lines
+        # let islice drive readline until EOF (signalled by an empty line) so that no Python code runs per line
+        return list(itertools.islice(iter(self.mm.readline, b""), num_lines))
 
     def close(self):
         self.mm.close()
@@ -652,10 +648,9 @@ def skip_lines(data_file_path, data_file, number_of_lines_to_skip):
 
     # fast forward to the last known file offset
     data_file.seek(offset)
-    # forward the last remaining lines if needed
+    # forward the last remaining lines if needed. Let islice drive readline and discard its results to keep the loop in C.
     if remaining_lines > 0:
-        for _ in range(remaining_lines):
-            data_file.readline()
+        collections.deque(itertools.islice(iter(data_file.readline, None), remaining_lines), maxlen=0)
 
 
 def get_size(start_path="."):
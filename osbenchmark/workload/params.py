@@ -24,7 +24,10 @@
 
 import collections
 import copy
+import functools
 import inspect
+import itertools
+import json
 import logging
 import math
 import numbers
@@ -459,17 +462,16 @@ class DeleteIndexTemplateParamSource(ParamSource):
                 raise exceptions.InvalidSyntax("The property 'index-pattern' is required for delete-index-template if "
                                                "'delete-matching-indices' is true.")
             self.template_definitions.append((template, delete_matching, index_pattern))
-
-    def params(self):
-        p = {}
-        # ensure we pass all parameters...
-        p.update(self._params)
-        p.update({
+        self._parsed_params = {
+            # ensure we pass all parameters...
+            **self._params,
             "templates": self.template_definitions,
             "only-if-exists": self.only_if_exists,
             "request-params": self.request_params
-        })
-        return p
+        }
+
+    def params(self):
+        return self._parsed_params
 
 
 class DeleteComponentTemplateParamSource(ParamSource):
@@ -522,23 +524,21 @@ class CreateTemplateParamSource(ABC, ParamSource):
 
     @staticmethod
     def _create_or_merge(content, path, new_content):
-        original_content = content
         if new_content:
+            node = content
             for sub_path in path:
-                if sub_path not in content:
-                    content[sub_path] = {}
-                content = content[sub_path]
-            CreateTemplateParamSource.__merge(content, new_content)
-        return original_content
+                node = node.setdefault(sub_path, {})
+            CreateTemplateParamSource.__merge(node, new_content)
+        return content
 
     @staticmethod
     def __merge(dct, merge_dct):
-        for k in merge_dct.keys():
-            if (k in dct and isinstance(dct[k], dict)
-                    and isinstance(merge_dct[k], collections.abc.Mapping)):
-                CreateTemplateParamSource.__merge(dct[k], merge_dct[k])
+        for k, v in merge_dct.items():
+            existing = dct.get(k)
+            if isinstance(existing, dict) and isinstance(v, collections.abc.Mapping):
+                CreateTemplateParamSource.__merge(existing, v)
             else:
-                dct[k] = merge_dct[k]
+                dct[k] = v
 
     def params(self):
         return {
@@ -856,16 +856,16 @@ class ForceMergeParamSource(ParamSource):
         self._max_num_segments = params.get("max-num-segments")
         self._poll_period = params.get("poll-period", 10)
         self._mode = params.get("mode", "blocking")
-
-    def params(self):
-        parsed_params = {
+        self._parsed_params = {
             "index": self._target_name,
             "max-num-segments": self._max_num_segments,
             "mode": self._mode,
             "poll-period": self._poll_period
         }
-        parsed_params.update(self._client_params())
-        return parsed_params
+        self._parsed_params.update(self._client_params())
+
+    def params(self):
+        return self._parsed_params
 
 
 class VectorSearchParamSource(SearchParamSource):
@@ -1350,23 +1350,18 @@ class BulkVectorsFromDataSetParamSource(VectorDataSetPartitionParamSource):
         """
         Create bulk ingest actions for data with a non-nested field.
         """
-        actions = []
-
-        _ = [
-                actions.extend([action(self.id_field_name, i + self.current), None])
-                for i in range(len(partition))
-            ]
-        bulk_contents = []
-
-        add_id_field_to_body = self.id_field_name != self.DEFAULT_ID_FIELD_NAME
-        for vec, identifier in zip(
-            partition.tolist(), range(self.current, self.current + len(partition))
-        ):
-            row = {self.field_name: vec}
-            if add_id_field_to_body:
-                row.update({self.id_field_name: identifier})
-            bulk_contents.append(row)
+        field_name = self.field_name
+        id_field_name = self.id_field_name
+        identifiers = range(self.current, self.current + len(partition))
+        # convert all vectors at once instead of boxing them row by row
+        vectors = partition.tolist()
+        if id_field_name != self.DEFAULT_ID_FIELD_NAME:
+            bulk_contents = [{field_name: vec, id_field_name: identifier} for vec, identifier in zip(vectors, identifiers)]
+        else:
+            bulk_contents = [{field_name: vec} for vec in vectors]
 
+        actions = [None] * (2 * len(bulk_contents))
+        actions[0::2] = [action(id_field_name, identifier) for identifier in identifiers]
         actions[1::2] = bulk_contents
         return actions
 
@@ -1518,18 +1513,38 @@ def number_of_bulks(corpora, start_partition_index, end_partition_index, total_p
     return bulks
 
 
-def build_conflicting_ids(conflicts, docs_to_index, offset, shuffle=random.shuffle):
+def build_conflicting_ids(conflicts, docs_to_index, offset, shuffle=None):
     if conflicts is None or conflicts == IndexIdConflict.NoConflicts:
         return None
-    all_ids = [0] * docs_to_index
-    for i in range(docs_to_index):
-        # always consider the offset as each client will index its own range and we don't want uncontrolled conflicts across clients
-        all_ids[i] = "%010d" % (offset + i)
-    if conflicts == IndexIdConflict.RandomConflicts:
+    # always consider the offset as each client will index its own range and we don't want uncontrolled conflicts across clients
+    ids = np.arange(offset, offset + docs_to_index, dtype=np.int64)
+    if conflicts == IndexIdConflict.RandomConflicts and shuffle is None:
+        np.random.default_rng().shuffle(ids)
+    all_ids = _format_ids(ids)
+    if conflicts == IndexIdConflict.RandomConflicts and shuffle is not None:
         shuffle(all_ids)
     return all_ids
 
 
+def _format_ids(ids, width=10):
+    """
+    Formats the provided ids as zero-padded ASCII byte strings (equivalent to ``b"%010d" % id``) in a vectorized manner.
+
+    :param ids: A one-dimensional numpy array of non-negative integer ids.
+    :param width: The minimum number of digits of each id.
+    :return: A list of ids as byte strings.
+    """
+    if len(ids) > 0 and ids.max() >= 10 ** width:
+        # ids have varying length; there is no fixed-width representation.
+        return [b"%0*d" % (width, i) for i in ids.tolist()]
+    digits = np.empty((len(ids), width), dtype=np.uint8)
+    remainder = ids
+    for position in range(width - 1, -1, -1):
+        remainder, digits[:, position] = np.divmod(remainder, 10)
+    digits += ord("0")
+    return digits.view(f"S{width}").ravel().tolist()
+
+
 def chain(*iterables):
     """
     Chains the given iterables similar to `itertools.chain` except that it also respects the context manager contract.
@@ -1540,8 +1555,7 @@ def chain(*iterables):
     for it in iterables:
         # execute within a context
         with it:
-            for element in it:
-                yield element
+            yield from it
 
 
 def create_default_reader(docs, offset, num_lines, num_docs, batch_size, bulk_size, id_conflicts, conflict_probability,
@@ -1671,36 +1685,96 @@ def bulk_data_based(num_clients, start_client_index, end_client_index, corpora,
     return bulk_generator(chain(*readers), pipeline, original_params)
 
 
+def _randint(a, b, rand=random.random):
+    """
+    Returns a random integer N such that ``a <= N <= b``. This is a faster replacement for ``random.randint`` which
+    performs (for our purposes) unnecessary argument validation in pure Python on every call.
+    """
+    return a + int(rand() * (b - a + 1))
+
+
+def _batched_samples(draw, batch_size=4096):
+    """
+    Creates a function that returns a single random sample per call. The samples are drawn ``batch_size`` at a time with
+    ``draw(batch_size)``, which needs to return a numpy array, so the cost of sampling is amortized across the batch.
+    """
+    return functools.partial(next, itertools.chain.from_iterable(iter(lambda: draw(batch_size).tolist(), None)))
+
+
 class GenerateActionMetaData:
     RECENCY_SLOPE = 30
 
     def __init__(self, index_name, type_name, conflicting_ids=None, conflict_probability=None, on_conflict=None, recency=None,
-                 rand=random.random, randint=random.randint, randexp=random.expovariate, use_create=False):
+                 rand=None, randint=_randint, randexp=None, use_create=False):
+        meta_data_fields = {"_index": index_name}
         if type_name:
-            self.meta_data_index_with_id = '{"index": {"_index": "%s", "_type": "%s", "_id": "%s"}}\n' % \
-                                           (index_name, type_name, "%s")
-            self.meta_data_update_with_id = '{"update": {"_index": "%s", "_type": "%s", "_id": "%s"}}\n' % \
-                                            (index_name, type_name, "%s")
-            self.meta_data_index_no_id = '{"index": {"_index": "%s", "_type": "%s"}}\n' % (index_name, type_name)
-        else:
-            self.meta_data_index_with_id = '{"index": {"_index": "%s", "_id": "%s"}}\n' % (index_name, "%s")
-            self.meta_data_update_with_id = '{"update": {"_index": "%s", "_id": "%s"}}\n' % (index_name, "%s")
-            self.meta_data_index_no_id = '{"index": {"_index": "%s"}}\n' % index_name
-            self.meta_data_create_no_id = '{"create": {"_index": "%s"}}\n' % index_name
+            meta_data_fields["_type"] = type_name
+        # let the JSON encoder take care of escaping but strip the surrounding braces so we can extend the meta-data. Names
+        # are kept as (UTF-8 encoded) literals instead of \u escapes.
+        meta_data = json.dumps(meta_data_fields, ensure_ascii=False)[1:-1]
+        # The action and meta-data lines only differ in the document id. Hence, we encode their static parts once
+        # and just splice in the (already encoded) id for each document.
+        self.meta_data_index_with_id = ('{"index": {%s, "_id": "' % meta_data).encode("utf-8")
+        self.meta_data_update_with_id = ('{"update": {%s, "_id": "' % meta_data).encode("utf-8")
+        self.meta_data_with_id_suffix = b'"}}\n'
+        self.meta_data_index_no_id = ('{"index": {%s}}\n' % meta_data).encode("utf-8")
+        self.meta_data_create_no_id = ('{"create": {%s}}\n' % meta_data).encode("utf-8")
         if use_create and conflicting_ids:
             raise exceptions.BenchmarkError("Index mode '_create' cannot be used with conflicting ids")
+        # conflicting ids are expected to be already formatted as bytes (see ``build_conflicting_ids()``)
         self.conflicting_ids = conflicting_ids
+        self.num_conflicting_ids = len(conflicting_ids) if conflicting_ids is not None else 0
         self.on_conflict = on_conflict
         self.use_create = use_create
         # random() produces numbers between 0 and 1 and the user denotes the probability in percentage between 0 and 100
         self.conflict_probability = conflict_probability / 100.0 if conflict_probability is not None else 0
+        # the action on conflicts is fixed so we can determine the corresponding template upfront
+        if conflicting_ids is not None and self.conflict_probability:
+            if on_conflict == "index":
+                self.meta_data_on_conflict_with_id = self.meta_data_index_with_id
+            elif on_conflict == "update":
+                self.meta_data_on_conflict_with_id = self.meta_data_update_with_id
+            else:
+                raise exceptions.BenchmarkAssertionError("Unknown action [{}]".format(on_conflict))
+        else:
+            self.meta_data_on_conflict_with_id = None
         self.recency = recency if recency is not None else 0
+        if self.recency > 0:
+            recency_lambda = GenerateActionMetaData.RECENCY_SLOPE * self.recency
+            if randexp is None:
+                rng = np.random.default_rng()
+                # exponentially distributed samples, capped at 1 (see _index_with_id_or_recent_conflict())
+                self.rand_recency = _batched_samples(lambda size: np.minimum(rng.exponential(1 / recency_lambda, size), 1))
+            else:
+                self.rand_recency = lambda: min(randexp(recency_lambda), 1)
+        else:
+            self.rand_recency = None
+
+        if self.conflict_probability:
+            probability = self.conflict_probability
+            if rand is None:
+                rng = np.random.default_rng()
+                # decide for a whole batch of documents at once whether they will produce a conflict
+                self.rand_conflict = _batched_samples(lambda size: rng.random(size) <= probability)
+            else:
+                self.rand_conflict = lambda: rand() <= probability
+        else:
+            self.rand_conflict = None
 
-        self.rand = rand
         self.randint = randint
-        self.randexp = randexp
         self.id_up_to = 0
 
+        # The configuration does not change so we select the matching implementation once instead of branching on
+        # it for every document.
+        if conflicting_ids is None:
+            self.next_action_meta_data = self._create_no_id if use_create else self._index_no_id
+        elif not self.conflict_probability:
+            self.next_action_meta_data = self._index_with_id
+        elif self.recency == 0:
+            self.next_action_meta_data = self._index_with_id_or_random_conflict
+        else:
+            self.next_action_meta_data = self._index_with_id_or_recent_conflict
+
     @property
     def is_constant(self):
         """
@@ -1712,41 +1786,41 @@ class GenerateActionMetaData:
         return self
 
     def __next__(self):
-        if self.conflicting_ids is not None:
-            if self.conflict_probability and self.id_up_to > 0 and self.rand() <= self.conflict_probability:
-                # a recency of zero means that we don't care about recency and just take a random number
-                # within the whole interval.
-                if self.recency == 0:
-                    idx = self.randint(0, self.id_up_to - 1)
-                else:
-                    # A recency > 0 biases id selection towards more recent ids. The recency parameter decides
-                    # by how much we bias. See docs for the resulting curve.
-                    #
-                    # idx_range is in the interval [0, 1].
-                    idx_range = min(self.randexp(GenerateActionMetaData.RECENCY_SLOPE * self.recency), 1)
-                    # the resulting index is in the range [0, self.id_up_to). Note that a smaller idx_range
-                    # biases towards more recently used ids (higher indexes).
-                    idx = round((self.id_up_to - 1) * (1 - idx_range))
-
-                doc_id = self.conflicting_ids[idx]
-                action = self.on_conflict
-            else:
-                if self.id_up_to >= len(self.conflicting_ids):
-                    raise StopIteration()
-                doc_id = self.conflicting_ids[self.id_up_to]
-                self.id_up_to += 1
-                action = "index"
-
-            if action == "index":
-                return "index", self.meta_data_index_with_id % doc_id
-            elif action == "update":
-                return "update", self.meta_data_update_with_id % doc_id
-            else:
-                raise exceptions.BenchmarkAssertionError("Unknown action [{}]".format(action))
-        else:
-            if self.use_create:
-                return "create", self.meta_data_create_no_id
-            return "index", self.meta_data_index_no_id
+        return self.next_action_meta_data()
+
+    def _index_no_id(self):
+        return "index", self.meta_data_index_no_id
+
+    def _create_no_id(self):
+        return "create", self.meta_data_create_no_id
+
+    def _index_with_id(self):
+        if self.id_up_to >= self.num_conflicting_ids:
+            raise StopIteration()
+        doc_id = self.conflicting_ids[self.id_up_to]
+        self.id_up_to += 1
+        return "index", self.meta_data_index_with_id + doc_id + self.meta_data_with_id_suffix
+
+    def _index_with_id_or_random_conflict(self):
+        if self.id_up_to > 0 and self.rand_conflict():
+            # a recency of zero means that we don't care about recency and just take a random number
+            # within the whole interval.
+            idx = self.randint(0, self.id_up_to - 1)
+            return self.on_conflict, self.meta_data_on_conflict_with_id + self.conflicting_ids[idx] + self.meta_data_with_id_suffix
+        return self._index_with_id()
+
+    def _index_with_id_or_recent_conflict(self):
+        if self.id_up_to > 0 and self.rand_conflict():
+            # A recency > 0 biases id selection towards more recent ids. The recency parameter decides
+            # by how much we bias. See docs for the resulting curve.
+            #
+            # idx_range is in the interval [0, 1].
+            idx_range = self.rand_recency()
+            # the resulting index is in the range [0, self.id_up_to). Note that a smaller idx_range
+            # biases towards more recently used ids (higher indexes).
+            idx = round((self.id_up_to - 1) * (1 - idx_range))
+            return self.on_conflict, self.meta_data_on_conflict_with_id + self.conflicting_ids[idx] + self.meta_data_with_id_suffix
+        return self._index_with_id()
 
 
 class Slice:
@@ -1861,14 +1935,14 @@ class MetadataIndexDataReader(IndexDataReader):
         """
         Special-case implementation for bulk data files where the action and meta-data line is always identical.
         """
-        current_bulk = []
         # hoist
-        action_metadata_line = self.action_metadata_line.encode("utf-8")
+        action_metadata_line = self.action_metadata_line
         docs = next(self.file_source)
 
-        for doc in docs:
-            current_bulk.append(action_metadata_line)
-            current_bulk.append(doc)
+        # every document is preceded by the same action and meta-data line. Interleave them with an extended slice
+        # assignment so the loop runs in C.
+        current_bulk = [action_metadata_line] * (2 * len(docs))
+        current_bulk[1::2] = docs
         return len(docs), current_bulk
 
     def _read_bulk_regular(self):
@@ -1878,11 +1952,13 @@ class MetadataIndexDataReader(IndexDataReader):
         """
         current_bulk = []
         docs = next(self.file_source)
+        # hoist
+        next_action_metadata = self.action_metadata.__next__
         for doc in docs:
-            action_metadata_item = next(self.action_metadata)
+            action_metadata_item = next_action_metadata()
             if action_metadata_item:
                 action_type, action_metadata_line = action_metadata_item
-                current_bulk.append(action_metadata_line.encode("utf-8"))
+                current_bulk.append(action_metadata_line)
                 if action_type == "update":
                     # remove the trailing "\n" as the doc needs to fit on one line
                     doc = doc.strip()
@@ -5,8 +5,11 @@
 # compatible open source license.
 import os
 import random
+import shutil
 import string
+import tempfile
 from abc import ABC, abstractmethod
+from typing import List
 
 import h5py
 import numpy as np
@@ -65,17 +68,22 @@ class DataSetBuilder(ABC):
         return self
 
     def build(self):
-        """ Builds and serializes all data sets build contexts
+        """ Builds and serializes all data sets build contexts. Each file is
+        written once, together with all data sets that belong to it.
         """
+        contexts_by_path = dict()
         for data_set_build_context in self.data_set_build_contexts:
-            self._build_data_set(data_set_build_context)
+            contexts_by_path.setdefault(data_set_build_context.path, []).append(data_set_build_context)
+        for path, contexts in contexts_by_path.items():
+            self._build_data_sets(path, contexts)
 
     @abstractmethod
-    def _build_data_set(self, context: DataSetBuildContext):
-        """ Builds an individual data set
+    def _build_data_sets(self, path: str, contexts: List[DataSetBuildContext]):
+        """ Builds all data sets that are stored in the same file
 
         Args:
-            context: DataSetBuildContext of data set to be built
+            path: path of the file to write
+            contexts: DataSetBuildContexts of data sets to be built
         """
 
     @abstractmethod
@@ -115,15 +123,14 @@ class HDF5Builder(DataSetBuilder):
         if ext != HDF5DataSet.FORMAT_NAME:
             raise IllegalDataSetBuildContext("Invalid file extension")
 
-    def _build_data_set(self, context: DataSetBuildContext):
-        # For HDF5, because multiple data sets can be grouped in the same file,
-        # we will build data sets in memory and not write to disk until
-        # _flush_data_sets_to_disk is called
-        with h5py.File(context.path, 'a') as hf:
-            hf.create_dataset(
-                HDF5DataSet.parse_context(context.data_set_context),
-                data=context.vectors
-            )
+    def _build_data_sets(self, path: str, contexts: List[DataSetBuildContext]):
+        # For HDF5, multiple data sets can be grouped in the same file
+        with h5py.File(path, 'a') as hf:
+            for context in contexts:
+                hf.create_dataset(
+                    HDF5DataSet.parse_context(context.data_set_context),
+                    data=context.vectors
+                )
 
 
 class BigANNVectorBuilder(DataSetBuilder):
@@ -156,10 +163,12 @@ class BigANNVectorBuilder(DataSetBuilder):
                                              .format(BigANNVectorDataSet
                                                      .FBIN_EXTENSION))
 
-    def _build_data_set(self, context: DataSetBuildContext):
+    def _build_data_sets(self, path: str, contexts: List[DataSetBuildContext]):
+        # paths are unique so there is exactly one data set per file
+        context, = contexts
         num_vectors = context.get_num_rows()
         dimension = context.get_row_length()
-        with open(context.path, 'wb') as f:
+        with open(path, 'wb') as f:
             f.write(int.to_bytes(num_vectors, 4, "little"))
             f.write(int.to_bytes(dimension, 4, "little"))
             context.vectors.tofile(f)
@@ -179,10 +188,12 @@ class BigANNGroundTruthBuilder(BigANNVectorBuilder):
                                              .format(BigANNGroundTruthDataSet
                                                      .BIN_EXTENSION))
 
-    def _build_data_set(self, context: DataSetBuildContext):
+    def _build_data_sets(self, path: str, contexts: List[DataSetBuildContext]):
+        # paths are unique so there is exactly one data set per file
+        context, = contexts
         num_queries = context.get_num_rows()
         k = context.get_row_length()
-        with open(context.path, 'wb') as f:
+        with open(path, 'wb') as f:
             # Writing number of queries
             f.write(int.to_bytes(num_queries, 4, "little"))
             # Writing number of neighbors in a query
@@ -266,6 +277,27 @@ def create_data_set(
     return data_set_path
 
 
+def create_query_and_neighbors_data_set(
+        num_vectors: int,
+        dimension: int,
+        data_set_dir
+) -> str:
+    """ Creates query vectors and their neighbors in the same HDF5 file
+    """
+    file_name_base = ''.join(random.choice(string.ascii_letters) for _ in
+                             range(DEFAULT_RANDOM_STRING_LENGTH))
+    data_set_file_name = "{}.{}".format(file_name_base, HDF5DataSet.FORMAT_NAME)
+    data_set_path = os.path.join(data_set_dir, data_set_file_name)
+    HDF5Builder() \
+        .add_data_set_build_context(DataSetBuildContext(
+            Context.QUERY, create_random_2d_array(num_vectors, dimension), data_set_path)) \
+        .add_data_set_build_context(DataSetBuildContext(
+            Context.NEIGHBORS, create_random_2d_array(num_vectors, dimension), data_set_path)) \
+        .build()
+
+    return data_set_path
+
+
 def create_attributes_data_set(
         num_vectors: int,
         dimension: int,
@@ -345,3 +377,19 @@ def create_ground_truth(
 
     BigANNGroundTruthBuilder().add_data_set_build_context(context).build()
     return data_set_path
+
+
+class SharedDataSetDirMixin:
+    """ Test case mixin providing a temporary directory for data sets that
+    are created once per test class and only read by its tests.
+
+    Attributes:
+        shared_data_set_dir: directory that is removed after the last test
+                             of the class has run.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.shared_data_set_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.shared_data_set_dir)
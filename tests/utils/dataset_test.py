@@ -3,9 +3,13 @@
 # The OpenSearch Contributors require contributions made to
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
+import os
 import tempfile
 from unittest import TestCase
 
+import h5py
+import numpy as np
+
 from osbenchmark.utils.dataset import Context, get_data_set, HDF5DataSet, BigANNVectorDataSet
 from osbenchmark.utils.parse import ConfigurationError
 from tests.utils.dataset_helper import create_data_set, create_ground_truth
@@ -66,3 +70,63 @@ class DataSetTestCase(TestCase):
     def testUnSupportedDataSetFormat(self):
         with self.assertRaises(ConfigurationError) as _:
             get_data_set("random", "/some/path", Context.INDEX)
+
+    def testHDF5ReadsAreServedFromReadAheadBuffer(self):
+        with tempfile.TemporaryDirectory() as data_set_dir:
+            num_vectors = 100
+            data_set_path = create_data_set(num_vectors, DEFAULT_DIMENSION, HDF5DataSet.FORMAT_NAME, DEFAULT_CONTEXT, data_set_dir)
+            with h5py.File(data_set_path) as f:
+                expected = f["train"][()]
+
+            data_set = HDF5DataSet(data_set_path, DEFAULT_CONTEXT)
+            # small read-ahead so that the buffer needs to be refilled a few times
+            data_set.READ_AHEAD_BYTES = 7 * DEFAULT_DIMENSION * expected.dtype.itemsize
+            actual = [data_set.read(3) for _ in range(34)]
+            self.assertIsNone(data_set.read(3))
+            np.testing.assert_array_equal(expected, np.concatenate(actual))
+
+            data_set.seek(42)
+            np.testing.assert_array_equal(expected[42:43], data_set.read(1))
+            data_set.seek(5)
+            np.testing.assert_array_equal(expected[5:15], data_set.read(10))
+
+    def testHDF5DataSetsOnSameFileKeepOwnPosition(self):
+        with tempfile.TemporaryDirectory() as data_set_dir:
+            data_set_path = create_data_set(DEFAULT_NUM_VECTORS, DEFAULT_DIMENSION, HDF5DataSet.FORMAT_NAME, DEFAULT_CONTEXT, data_set_dir)
+            first = HDF5DataSet(data_set_path, DEFAULT_CONTEXT)
+            second = HDF5DataSet(data_set_path, DEFAULT_CONTEXT)
+            second.seek(5)
+
+            # each data set keeps its own position
+            np.testing.assert_array_equal(first.read(DEFAULT_NUM_VECTORS)[5:6], second.read(1))
+            # ... but both read from the same file handle
+            self.assertEqual(1, len(self._open_file_ids(data_set_path)))
+
+            first.close()
+            self.assertEqual(1, len(self._open_file_ids(data_set_path)))
+            del second
+            self.assertEqual(0, len(self._open_file_ids(data_set_path)))
+            # the file is not kept open so it can be rewritten
+            with h5py.File(data_set_path, "w") as f:
+                f.create_dataset("train", data=np.zeros((1, DEFAULT_DIMENSION)))
+            self.assertEqual(1, HDF5DataSet(data_set_path, DEFAULT_CONTEXT).size())
+
+    @staticmethod
+    def _open_file_ids(path):
+        return [file_id for file_id in h5py.h5f.get_obj_ids(types=h5py.h5f.OBJ_FILE) if file_id.name == path.encode()]
+
+    def testBigANNReadsDecodeWholeChunk(self):
+        expected = np.arange(DEFAULT_NUM_VECTORS * DEFAULT_DIMENSION, dtype="<f4").reshape(DEFAULT_NUM_VECTORS, DEFAULT_DIMENSION)
+        with tempfile.TemporaryDirectory() as data_set_dir:
+            data_set_path = os.path.join(data_set_dir, "data.fbin")
+            with open(data_set_path, "wb") as f:
+                f.write(np.array([DEFAULT_NUM_VECTORS, DEFAULT_DIMENSION], dtype="<u4").tobytes())
+                f.write(expected.tobytes())
+
+            data_set = get_data_set("bigann", data_set_path, DEFAULT_CONTEXT)
+            np.testing.assert_array_equal(expected[:4], data_set.read(4))
+            np.testing.assert_array_equal(expected[4:5], data_set.read(1))
+            data_set.seek(DEFAULT_NUM_VECTORS - 2)
+            # reads at most until the end of the data set
+            np.testing.assert_array_equal(expected[-2:], data_set.read(10))
+            self.assertIsNone(data_set.read(1))
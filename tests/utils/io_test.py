@@ -73,6 +73,33 @@ class IoTests(TestCase):
         # no extension whatsoever
         self.assertFalse(io.has_extension("/tmp/README", "README"))
 
+    def test_mmap_source_readlines(self):
+        tmp_dir = tempfile.mkdtemp()
+        data_file = os.path.join(tmp_dir, "docs.json")
+        with open(data_file, "wb") as f:
+            f.write(b'{"key": "value1"}\n{"key": "value2"}\n{"key": "value3"}\n')
+
+        with io.MmapSource(data_file, "rt") as source:
+            self.assertEqual([b'{"key": "value1"}\n', b'{"key": "value2"}\n'], source.readlines(2))
+            # reads at most until the end of the file
+            self.assertEqual([b'{"key": "value3"}\n'], source.readlines(2))
+            self.assertEqual([], source.readlines(2))
+
+    def test_skip_lines(self):
+        tmp_dir = tempfile.mkdtemp()
+        data_file = os.path.join(tmp_dir, "docs.json")
+        with open(data_file, "wb") as f:
+            f.write(b'{"key": "value1"}\n{"key": "value2"}\n{"key": "value3"}\n')
+
+        with io.MmapSource(data_file, "rt") as source:
+            io.skip_lines(data_file, source, 2)
+            self.assertEqual(b'{"key": "value3"}\n', source.readline())
+
+        with io.MmapSource(data_file, "rt") as source:
+            # skipping beyond the end of the file is fine
+            io.skip_lines(data_file, source, 5)
+            self.assertEqual(b"", source.readline())
+
 
 class TestDecompression:
     def test_decompresses_supported_file_formats(self):
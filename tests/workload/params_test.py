@@ -26,8 +26,10 @@
 import random
 import shutil
 import tempfile
+import unittest.mock as mock
 from unittest import TestCase
 
+import h5py
 import numpy as np
 
 from osbenchmark import exceptions
@@ -37,15 +39,19 @@ from osbenchmark.utils.parse import ConfigurationError
 from osbenchmark.workload import params, workload, loader
 from osbenchmark.workload.params import VectorDataSetPartitionParamSource, VectorSearchPartitionParamSource, \
     BulkVectorsFromDataSetParamSource
-from tests.utils.dataset_helper import create_data_set, create_attributes_data_set, create_parent_data_set
+from tests.utils.dataset_helper import create_data_set, create_attributes_data_set, create_parent_data_set, \
+    create_query_and_neighbors_data_set, SharedDataSetDirMixin
 from tests.utils.dataset_test import DEFAULT_NUM_VECTORS
 
 
 class StaticBulkReader:
+    __slots__ = ("index_name", "type_name", "batches")
+
     def __init__(self, index_name, type_name, bulks):
         self.index_name = index_name
         self.type_name = type_name
-        self.bulks = iter(bulks)
+        # each batch consists of exactly one bulk
+        self.batches = iter([(index_name, type_name, [(len(bulk), bulk)]) for bulk in bulks])
 
     def __enter__(self):
         return self
@@ -54,10 +60,7 @@ class StaticBulkReader:
         return self
 
     def __next__(self):
-        batch = []
-        bulk = next(self.bulks)
-        batch.append((len(bulk), bulk))
-        return self.index_name, self.type_name, batch
+        return next(self.batches)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         return False
@@ -106,51 +109,59 @@ class ConflictingIdsBuilderTests(TestCase):
     def test_sequential_conflicts(self):
         self.assertEqual(
             [
-                '0000000000',
-                '0000000001',
-                '0000000002',
-                '0000000003',
-                '0000000004',
-                '0000000005',
-                '0000000006',
-                '0000000007',
-                '0000000008',
-                '0000000009',
-                '0000000010'
+                b'0000000000',
+                b'0000000001',
+                b'0000000002',
+                b'0000000003',
+                b'0000000004',
+                b'0000000005',
+                b'0000000006',
+                b'0000000007',
+                b'0000000008',
+                b'0000000009',
+                b'0000000010'
             ],
             params.build_conflicting_ids(params.IndexIdConflict.SequentialConflicts, 11, 0)
         )
 
         self.assertEqual(
             [
-                '0000000005',
-                '0000000006',
-                '0000000007',
-                '0000000008',
-                '0000000009',
-                '0000000010',
-                '0000000011',
-                '0000000012',
-                '0000000013',
-                '0000000014',
-                '0000000015'
+                b'0000000005',
+                b'0000000006',
+                b'0000000007',
+                b'0000000008',
+                b'0000000009',
+                b'0000000010',
+                b'0000000011',
+                b'0000000012',
+                b'0000000013',
+                b'0000000014',
+                b'0000000015'
             ],
             params.build_conflicting_ids(params.IndexIdConflict.SequentialConflicts, 11, 5)
         )
 
+        self.assertEqual(
+            [
+                b'9999999999',
+                b'10000000000'
+            ],
+            params.build_conflicting_ids(params.IndexIdConflict.SequentialConflicts, 2, 9999999999)
+        )
+
     def test_random_conflicts(self):
         predictable_shuffle = list.reverse
 
         self.assertEqual(
             [
-                '0000000002', '0000000001', '0000000000'
+                b'0000000002', b'0000000001', b'0000000000'
             ],
             params.build_conflicting_ids(params.IndexIdConflict.RandomConflicts, 3, 0, shuffle=predictable_shuffle)
         )
 
         self.assertEqual(
             [
-                '0000000007', '0000000006', '0000000005'
+                b'0000000007', b'0000000006', b'0000000005'
             ],
             params.build_conflicting_ids(params.IndexIdConflict.RandomConflicts, 3, 5, shuffle=predictable_shuffle)
         )
@@ -158,29 +169,47 @@ class ConflictingIdsBuilderTests(TestCase):
 
 class ActionMetaDataTests(TestCase):
     def test_generate_action_meta_data_without_id_conflicts(self):
-        self.assertEqual(("index", '{"index": {"_index": "test_index", "_type": "test_type"}}\n'),
+        self.assertEqual(("index", b'{"index": {"_index": "test_index", "_type": "test_type"}}\n'),
                          next(params.GenerateActionMetaData("test_index", "test_type")))
 
+    def test_generate_action_meta_data_escapes_names(self):
+        self.assertEqual(("index", b'{"index": {"_index": "test_index", "_type": "test\\"type"}}\n'),
+                         next(params.GenerateActionMetaData("test_index", 'test"type')))
+
+    def test_generate_action_meta_data_with_non_ascii_names(self):
+        self.assertEqual(("index", '{"index": {"_index": "tést_index", "_type": "测试"}}\n'.encode("utf-8")),
+                         next(params.GenerateActionMetaData("tést_index", "测试")))
+
+    def test_generate_action_meta_data_with_id_without_type(self):
+        self.assertEqual(("index", b'{"index": {"_index": "test_index", "_id": "100"}}\n'),
+                         next(params.GenerateActionMetaData("test_index", None, conflicting_ids=[b"100"])))
+
     def test_generate_action_meta_data_create(self):
-        self.assertEqual(("create", '{"create": {"_index": "test_index"}}\n'),
+        self.assertEqual(("create", b'{"create": {"_index": "test_index"}}\n'),
                          next(params.GenerateActionMetaData("test_index", None, use_create=True)))
 
     def test_generate_action_meta_data_create_with_conflicts(self):
         with self.assertRaises(exceptions.BenchmarkError) as ctx:
-            params.GenerateActionMetaData("test_index", None, conflicting_ids=[100, 200, 300, 400], use_create=True)
+            params.GenerateActionMetaData("test_index", None, conflicting_ids=[b"100", b"200", b"300", b"400"], use_create=True)
         self.assertEqual("Index mode '_create' cannot be used with conflicting ids",
                          ctx.exception.args[0])
 
+    def test_generate_action_meta_data_with_unknown_conflict_action(self):
+        with self.assertRaises(exceptions.BenchmarkAssertionError) as ctx:
+            params.GenerateActionMetaData("test_index", None, conflicting_ids=[b"100", b"200"], conflict_probability=25,
+                                          on_conflict="delete")
+        self.assertEqual("Unknown action [delete]", ctx.exception.args[0])
+
     def test_generate_action_meta_data_typeless(self):
-        self.assertEqual(("index", '{"index": {"_index": "test_index"}}\n'),
+        self.assertEqual(("index", b'{"index": {"_index": "test_index"}}\n'),
                          next(params.GenerateActionMetaData("test_index", type_name=None)))
 
     def test_generate_action_meta_data_with_id_conflicts(self):
         def idx(id):
-            return "index", '{"index": {"_index": "test_index", "_type": "test_type", "_id": "%s"}}\n' % id
+            return "index", b'{"index": {"_index": "test_index", "_type": "test_type", "_id": "%b"}}\n' % id
 
         def conflict(action, id):
-            return action, '{"%s": {"_index": "test_index", "_type": "test_type", "_id": "%s"}}\n' % (action, id)
+            return action, b'{"%b": {"_index": "test_index", "_type": "test_type", "_id": "%b"}}\n' % (action.encode(), id)
 
         pseudo_random_conflicts = iter([
             # if this value is <= our chosen threshold of 0.25 (see conflict_probability) we produce a conflict.
@@ -203,35 +232,35 @@ class ActionMetaDataTests(TestCase):
         conflict_action = random.choice(["index", "update"])
 
         generator = params.GenerateActionMetaData("test_index", "test_type",
-                                                  conflicting_ids=[100, 200, 300, 400],
+                                                  conflicting_ids=[b"100", b"200", b"300", b"400"],
                                                   conflict_probability=25,
                                                   on_conflict=conflict_action,
                                                   rand=lambda: next(pseudo_random_conflicts),
                                                   randint=lambda x, y: next(chosen_index_of_conflicting_ids))
 
         # first one is always *not* drawn from a random index
-        self.assertEqual(idx("100"), next(generator))
+        self.assertEqual(idx(b"100"), next(generator))
         # now we start using random ids, i.e. look in the first line of the pseudo-random sequence
-        self.assertEqual(conflict(conflict_action, "200"), next(generator))
-        self.assertEqual(conflict(conflict_action, "400"), next(generator))
-        self.assertEqual(conflict(conflict_action, "300"), next(generator))
+        self.assertEqual(conflict(conflict_action, b"200"), next(generator))
+        self.assertEqual(conflict(conflict_action, b"400"), next(generator))
+        self.assertEqual(conflict(conflict_action, b"300"), next(generator))
         # no conflict -> we draw the next sequential one, which is 200
-        self.assertEqual(idx("200"), next(generator))
+        self.assertEqual(idx(b"200"), next(generator))
         # and we're back to random
-        self.assertEqual(conflict(conflict_action, "100"), next(generator))
+        self.assertEqual(conflict(conflict_action, b"100"), next(generator))
 
     def test_generate_action_meta_data_with_id_conflicts_and_recency_bias(self):
         def idx(type_name, id):
             if type_name:
-                return "index", '{"index": {"_index": "test_index", "_type": "%s", "_id": "%s"}}\n' % (type_name, id)
+                return "index", b'{"index": {"_index": "test_index", "_type": "%b", "_id": "%b"}}\n' % (type_name.encode(), id)
             else:
-                return "index", '{"index": {"_index": "test_index", "_id": "%s"}}\n' % id
+                return "index", b'{"index": {"_index": "test_index", "_id": "%b"}}\n' % id
 
         def conflict(action, type_name, id):
             if type_name:
-                return action, '{"%s": {"_index": "test_index", "_type": "%s", "_id": "%s"}}\n' % (action, type_name, id)
+                return action, b'{"%b": {"_index": "test_index", "_type": "%b", "_id": "%b"}}\n' % (action.encode(), type_name.encode(), id)
             else:
-                return action, '{"%s": {"_index": "test_index", "_id": "%s"}}\n' % (action, id)
+                return action, b'{"%b": {"_index": "test_index", "_id": "%b"}}\n' % (action.encode(), id)
 
         pseudo_random_conflicts = iter([
             # if this value is <= our chosen threshold of 0.25 (see conflict_probability) we produce a conflict.
@@ -269,7 +298,7 @@ class ActionMetaDataTests(TestCase):
         type_name = random.choice([None, "test_type"])
 
         generator = params.GenerateActionMetaData("test_index", type_name=type_name,
-                                                  conflicting_ids=[100, 200, 300, 400, 500, 600],
+                                                  conflicting_ids=[b"100", b"200", b"300", b"400", b"500", b"600"],
                                                   conflict_probability=25,
                                                   # heavily biased towards recent ids
                                                   recency=1.0,
@@ -281,24 +310,64 @@ class ActionMetaDataTests(TestCase):
                                                   )
 
         # first one is always *not* drawn from a random index
-        self.assertEqual(idx(type_name, "100"), next(generator))
+        self.assertEqual(idx(type_name, b"100"), next(generator))
         # now we start using random ids
-        self.assertEqual(conflict(conflict_action, type_name, "100"), next(generator))
-        self.assertEqual(conflict(conflict_action, type_name, "100"), next(generator))
-        self.assertEqual(conflict(conflict_action, type_name, "100"), next(generator))
+        self.assertEqual(conflict(conflict_action, type_name, b"100"), next(generator))
+        self.assertEqual(conflict(conflict_action, type_name, b"100"), next(generator))
+        self.assertEqual(conflict(conflict_action, type_name, b"100"), next(generator))
         # no conflict
-        self.assertEqual(idx(type_name, "200"), next(generator))
-        self.assertEqual(idx(type_name, "300"), next(generator))
-        self.assertEqual(idx(type_name, "400"), next(generator))
+        self.assertEqual(idx(type_name, b"200"), next(generator))
+        self.assertEqual(idx(type_name, b"300"), next(generator))
+        self.assertEqual(idx(type_name, b"400"), next(generator))
         # conflict
-        self.assertEqual(conflict(conflict_action, type_name, "400"), next(generator))
-        self.assertEqual(conflict(conflict_action, type_name, "300"), next(generator))
+        self.assertEqual(conflict(conflict_action, type_name, b"400"), next(generator))
+        self.assertEqual(conflict(conflict_action, type_name, b"300"), next(generator))
+
+    def test_randint_is_within_bounds(self):
+        self.assertEqual(3, params._randint(3, 7, rand=lambda: 0.0))
+        self.assertEqual(5, params._randint(3, 7, rand=lambda: 0.5))
+        self.assertEqual(7, params._randint(3, 7, rand=lambda: 0.9999999999))
+        for _ in range(100):
+            self.assertTrue(0 <= params._randint(0, 3) <= 3)
+
+    def test_batched_samples(self):
+        sample = params._batched_samples(np.arange, batch_size=3)
+        self.assertEqual([0, 1, 2, 0, 1], [sample() for _ in range(5)])
+
+    def test_generate_action_meta_data_with_id_conflicts_and_default_recency_sampling(self):
+        conflicting_ids = [b"100", b"200", b"300", b"400"]
+        generator = params.GenerateActionMetaData("test_index", None,
+                                                  conflicting_ids=conflicting_ids,
+                                                  conflict_probability=100,
+                                                  recency=0.5,
+                                                  on_conflict="update")
+
+        self.assertEqual(("index", b'{"index": {"_index": "test_index", "_id": "100"}}\n'), next(generator))
+        # every subsequent id conflicts with the only id that has been indexed so far
+        for _ in range(100):
+            self.assertEqual(("update", b'{"update": {"_index": "test_index", "_id": "100"}}\n'), next(generator))
+
+    def test_generate_action_meta_data_with_id_conflicts_and_default_sampling(self):
+        generator = params.GenerateActionMetaData("test_index", None,
+                                                  conflicting_ids=[b"100", b"200", b"300", b"400"],
+                                                  conflict_probability=50,
+                                                  on_conflict="update")
+
+        indexed_ids = []
+        # the generator stops after it has run out of (non-conflicting) ids
+        for action, meta_data in generator:
+            if action == "index":
+                indexed_ids.append(meta_data)
+            else:
+                self.assertIn(meta_data.replace(b"update", b"index"), indexed_ids)
+        self.assertEqual([b'{"index": {"_index": "test_index", "_id": "%b"}}\n' % doc_id
+                          for doc_id in [b"100", b"200", b"300", b"400"]], indexed_ids)
 
     def test_generate_action_meta_data_with_id_and_zero_conflict_probability(self):
         def idx(id):
-            return "index", '{"index": {"_index": "test_index", "_type": "test_type", "_id": "%s"}}\n' % id
+            return "index", b'{"index": {"_index": "test_index", "_type": "test_type", "_id": "%b"}}\n' % id
 
-        test_ids = [100, 200, 300, 400]
+        test_ids = [b"100", b"200", b"300", b"400"]
 
         generator = params.GenerateActionMetaData("test_index", "test_type",
                                                   conflicting_ids=test_ids,
@@ -477,7 +546,7 @@ class IndexDataReaderTests(TestCase):
 
         source = params.Slice(io.StringAsFileSource, 0, len(data))
         am_handler = params.GenerateActionMetaData("test_index", "test_type",
-                                                   conflicting_ids=[100, 200, 300, 400],
+                                                   conflicting_ids=[b"100", b"200", b"300", b"400"],
                                                    conflict_probability=25,
                                                    on_conflict="update",
                                                    rand=lambda: next(pseudo_random_conflicts),
@@ -522,7 +591,7 @@ class IndexDataReaderTests(TestCase):
 
         source = params.Slice(io.StringAsFileSource, 0, len(data))
         am_handler = params.GenerateActionMetaData("test_index", "test_type",
-                                                   conflicting_ids=[100, 200, 300, 400],
+                                                   conflicting_ids=[b"100", b"200", b"300", b"400"],
                                                    conflict_probability=0)
 
         reader = params.MetadataIndexDataReader(data,
@@ -667,42 +736,53 @@ class InvocationGeneratorTests(TestCase):
         self.assertEqual((4666, 584, 1168), params.bounds(num_docs, 4, 4, clients, includes_action_and_meta_data=True))
         self.assertEqual((5834, 583, 1166), params.bounds(num_docs, 5, 5, clients, includes_action_and_meta_data=True))
 
-    def test_calculate_bounds_for_multiple_clients_per_worker(self):
-        num_docs = 2000
-        clients = 8
+    # (num_docs, start_client_index, end_client_index, clients, includes_action_and_meta_data, expected bounds)
+    MULTIPLE_CLIENTS_PER_WORKER_BOUNDS_CASES = [
         # four clients per worker, each reads 250 lines
-        self.assertEqual((0, 1000, 1000), params.bounds(num_docs, 0, 3, clients, includes_action_and_meta_data=False))
-        self.assertEqual((1000, 1000, 1000), params.bounds(num_docs, 4, 7, clients, includes_action_and_meta_data=False))
-
+        (2000, 0, 3, 8, False, (0, 1000, 1000)),
+        (2000, 4, 7, 8, False, (1000, 1000, 1000)),
         # four clients per worker, each reads 500 lines (includes action and metadata)
-        self.assertEqual((0, 1000, 2000), params.bounds(num_docs, 0, 3, clients, includes_action_and_meta_data=True))
-        self.assertEqual((2000, 1000, 2000), params.bounds(num_docs, 4, 7, clients, includes_action_and_meta_data=True))
+        (2000, 0, 3, 8, True, (0, 1000, 2000)),
+        (2000, 4, 7, 8, True, (2000, 1000, 2000)),
+    ]
+
+    def test_calculate_bounds_for_multiple_clients_per_worker(self):
+        for num_docs, start_client_index, end_client_index, clients, includes_action_and_meta_data, expected in \
+                self.MULTIPLE_CLIENTS_PER_WORKER_BOUNDS_CASES:
+            with self.subTest(num_docs=num_docs, start_client_index=start_client_index, end_client_index=end_client_index, clients=clients,
+                              includes_action_and_meta_data=includes_action_and_meta_data):
+                self.assertEqual(expected, params.bounds(num_docs, start_client_index, end_client_index, clients,
+                                                         includes_action_and_meta_data=includes_action_and_meta_data))
 
     def test_calculate_number_of_bulks(self):
         docs1 = self.docs(1)
         docs2 = self.docs(2)
+        two_corpora = [self.corpus("a", [docs2, docs2, docs2, docs2, docs1]),
+                       self.corpus("b", [docs2, docs2, docs2, docs2, docs2, docs1])]
+
+        # (corpora, first_partition_index, last_partition_index, total_partitions, bulk_size, expected number of bulks)
+        cases = [
+            ([self.corpus("a", [docs1])], 0, 0, 1, 1, 1),
+            ([self.corpus("a", [docs1])], 0, 0, 1, 2, 1),
+            (two_corpora, 0, 0, 1, 1, 20),
+            (two_corpora, 0, 0, 1, 2, 11),
+            (two_corpora, 0, 0, 1, 3, 11),
+            (two_corpora, 0, 0, 1, 100, 11),
+            ([self.corpus("a", [self.docs(800)])], 0, 0, 3, 250, 2),
+            ([self.corpus("a", [self.docs(800)])], 0, 0, 3, 267, 1),
+        ]
+        for corpora, first_partition_index, last_partition_index, total_partitions, bulk_size, expected in cases:
+            with self.subTest(documents=[[docs.number_of_documents for docs in corpus.documents] for corpus in corpora],
+                              first_partition_index=first_partition_index, last_partition_index=last_partition_index,
+                              total_partitions=total_partitions, bulk_size=bulk_size):
+                self.assertEqual(expected, self.number_of_bulks(corpora, first_partition_index, last_partition_index,
+                                                                total_partitions, bulk_size))
 
-        self.assertEqual(1, self.number_of_bulks([self.corpus("a", [docs1])], 0, 0, 1, 1))
-        self.assertEqual(1, self.number_of_bulks([self.corpus("a", [docs1])], 0, 0, 1, 2))
-        self.assertEqual(20, self.number_of_bulks(
-            [self.corpus("a", [docs2, docs2, docs2, docs2, docs1]),
-             self.corpus("b", [docs2, docs2, docs2, docs2, docs2, docs1])], 0, 0, 1, 1))
-        self.assertEqual(11, self.number_of_bulks(
-            [self.corpus("a", [docs2, docs2, docs2, docs2, docs1]),
-             self.corpus("b", [docs2, docs2, docs2, docs2, docs2, docs1])], 0, 0, 1, 2))
-        self.assertEqual(11, self.number_of_bulks(
-            [self.corpus("a", [docs2, docs2, docs2, docs2, docs1]),
-             self.corpus("b", [docs2, docs2, docs2, docs2, docs2, docs1])], 0, 0, 1, 3))
-        self.assertEqual(11, self.number_of_bulks(
-            [self.corpus("a", [docs2, docs2, docs2, docs2, docs1]),
-             self.corpus("b", [docs2, docs2, docs2, docs2, docs2, docs1])], 0, 0, 1, 100))
-
-        self.assertEqual(2, self.number_of_bulks([self.corpus("a", [self.docs(800)])], 0, 0, 3, 250))
-        self.assertEqual(1, self.number_of_bulks([self.corpus("a", [self.docs(800)])], 0, 0, 3, 267))
-        self.assertEqual(1, self.number_of_bulks([self.corpus("a", [self.docs(80)])], 0, 0, 3, 267))
         # this looks odd at first but we are prioritizing number of clients above bulk size
-        self.assertEqual(1, self.number_of_bulks([self.corpus("a", [self.docs(80)])], 1, 1, 3, 267))
-        self.assertEqual(1, self.number_of_bulks([self.corpus("a", [self.docs(80)])], 2, 2, 3, 267))
+        corpora_80 = [self.corpus("a", [self.docs(80)])]
+        for partition_idx in (0, 1, 2):
+            with self.subTest(partition=partition_idx):
+                self.assertEqual(1, self.number_of_bulks(corpora_80, partition_idx, partition_idx, 3, 267))
 
     @staticmethod
     def corpus(name, docs):
@@ -718,95 +798,86 @@ class InvocationGeneratorTests(TestCase):
 
     def test_build_conflicting_ids(self):
         self.assertIsNone(params.build_conflicting_ids(params.IndexIdConflict.NoConflicts, 3, 0))
-        self.assertEqual(["0000000000", "0000000001", "0000000002"],
+        self.assertEqual([b"0000000000", b"0000000001", b"0000000002"],
                          params.build_conflicting_ids(params.IndexIdConflict.SequentialConflicts, 3, 0))
         # we cannot tell anything specific about the contents...
         self.assertEqual(3, len(params.build_conflicting_ids(params.IndexIdConflict.RandomConflicts, 3, 0)))
 
 
+def _make_two_corpora(num_default_docs, num_special_docs):
+    return [
+        workload.DocumentCorpus(name="default", documents=[
+            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
+                               number_of_documents=num_default_docs,
+                               target_index="test-idx",
+                               target_type="test-type"
+                               )
+        ]),
+        workload.DocumentCorpus(name="special", documents=[
+            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
+                               number_of_documents=num_special_docs,
+                               target_index="test-idx2",
+                               target_type="type"
+                               )
+        ]),
+    ]
+
+
 # pylint: disable=too-many-public-methods
 class BulkIndexParamSourceTests(TestCase):
-    def test_create_without_params(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
+    @classmethod
+    def setUpClass(cls):
+        cls.default_corpus = workload.DocumentCorpus(name="default", documents=[
             workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
-
+                               number_of_documents=10,
+                               target_index="test-idx",
+                               target_type="test-type"
+                               )])
+        cls.default_workload = workload.Workload(name="unit-test", corpora=[cls.default_corpus])
+
+    def _assert_invalid(self, invalid_params, expected_message, corpora=None, unit_test_workload=None):
+        if unit_test_workload is None:
+            unit_test_workload = workload.Workload(name="unit-test", corpora=corpora)
         with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={})
+            params.BulkIndexParamSource(workload=unit_test_workload, params=invalid_params)
 
-        self.assertEqual("Mandatory parameter 'bulk-size' is missing", ctx.exception.args[0])
-
-    def test_create_without_corpora_definition(self):
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test"), params={})
+        self.assertEqual(expected_message, ctx.exception.args[0])
 
-        self.assertEqual("There is no document corpus definition for workload unit-test. "
-                         "You must add at least one before making bulk requests to OpenSearch.", ctx.exception.args[0])
+    def test_create_without_params(self):
+        self._assert_invalid({}, "Mandatory parameter 'bulk-size' is missing",
+                             unit_test_workload=self.default_workload)
 
     def test_create_with_non_numeric_bulk_size(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
-
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={
-                "bulk-size": "Three"
-            })
-
-        self.assertEqual("'bulk-size' must be numeric", ctx.exception.args[0])
+        self._assert_invalid({"bulk-size": "Three"}, "'bulk-size' must be numeric",
+                             unit_test_workload=self.default_workload)
 
     def test_create_with_negative_bulk_size(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
-
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={
-                "bulk-size": -5
-            })
-
-        self.assertEqual("'bulk-size' must be positive but was -5", ctx.exception.args[0])
+        self._assert_invalid({"bulk-size": -5}, "'bulk-size' must be positive but was -5",
+                             unit_test_workload=self.default_workload)
 
     def test_create_with_fraction_smaller_batch_size(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
+        self._assert_invalid({"bulk-size": 5, "batch-size": 3}, "'batch-size' must be greater than or equal to 'bulk-size'",
+                             unit_test_workload=self.default_workload)
 
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={
-                "bulk-size": 5,
-                "batch-size": 3
-            })
+    def test_create_with_fraction_larger_batch_size(self):
+        self._assert_invalid({"bulk-size": 5, "batch-size": 8}, "'batch-size' must be a multiple of 'bulk-size'",
+                             unit_test_workload=self.default_workload)
 
-        self.assertEqual("'batch-size' must be greater than or equal to 'bulk-size'", ctx.exception.args[0])
+    def test_create_with_ingest_percentage_too_low(self):
+        self._assert_invalid({"bulk-size": 5000, "ingest-percentage": 0.0}, "'ingest-percentage' must be in the range (0.0, 100.0] but was 0.0",
+                             unit_test_workload=self.default_workload)
 
-    def test_create_with_fraction_larger_batch_size(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
+    def test_create_with_ingest_percentage_too_high(self):
+        self._assert_invalid({"bulk-size": 5000, "ingest-percentage": 100.1}, "'ingest-percentage' must be in the range (0.0, 100.0] but was 100.1",
+                             unit_test_workload=self.default_workload)
 
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={
-                "bulk-size": 5,
-                "batch-size": 8
-            })
+    def test_create_with_ingest_percentage_not_numeric(self):
+        self._assert_invalid({"bulk-size": 5000, "ingest-percentage": "100 percent"}, "'ingest-percentage' must be numeric",
+                             unit_test_workload=self.default_workload)
 
-        self.assertEqual("'batch-size' must be a multiple of 'bulk-size'", ctx.exception.args[0])
+    def test_create_without_corpora_definition(self):
+        self._assert_invalid({}, "There is no document corpus definition for workload unit-test. "
+                                 "You must add at least one before making bulk requests to OpenSearch.")
 
     def test_create_with_metadata_in_source_file_but_conflicts(self):
         corpus = workload.DocumentCorpus(name="default", documents=[
@@ -817,97 +888,22 @@ class BulkIndexParamSourceTests(TestCase):
                             includes_action_and_meta_data=True)
         ])
 
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={
-                "conflicts": "random"
-            })
-
-        self.assertEqual("Cannot generate id conflicts [random] as [docs.json.bz2] in document corpus [default] already contains "
-                         "an action and meta-data line.", ctx.exception.args[0])
+        self._assert_invalid({"conflicts": "random"},
+                             "Cannot generate id conflicts [random] as [docs.json.bz2] in document corpus [default] already contains "
+                             "an action and meta-data line.", corpora=[corpus])
 
     def test_create_with_unknown_id_conflicts(self):
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test"), params={
-                "conflicts": "crazy"
-            })
-
-        self.assertEqual("Unknown 'conflicts' setting [crazy]", ctx.exception.args[0])
+        self._assert_invalid({"conflicts": "crazy"}, "Unknown 'conflicts' setting [crazy]")
 
     def test_create_with_unknown_on_conflict_setting(self):
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test"), params={
-                "conflicts": "sequential",
-                "on-conflict": "delete"
-            })
-
-        self.assertEqual("Unknown 'on-conflict' setting [delete]", ctx.exception.args[0])
+        self._assert_invalid({"conflicts": "sequential", "on-conflict": "delete"}, "Unknown 'on-conflict' setting [delete]")
 
     def test_create_with_conflicts_and_data_streams(self):
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test"), params={
-                "data-streams": ["test-data-stream-1", "test-data-stream-2"],
-                "conflicts": "sequential"
-            })
-
-        self.assertEqual("'conflicts' cannot be used with 'data-streams'", ctx.exception.args[0])
-
-    def test_create_with_ingest_percentage_too_low(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
-
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={
-                "bulk-size": 5000,
-                "ingest-percentage": 0.0
-            })
-
-        self.assertEqual("'ingest-percentage' must be in the range (0.0, 100.0] but was 0.0", ctx.exception.args[0])
-
-    def test_create_with_ingest_percentage_too_high(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
-
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={
-                "bulk-size": 5000,
-                "ingest-percentage": 100.1
-            })
-
-        self.assertEqual("'ingest-percentage' must be in the range (0.0, 100.0] but was 100.1", ctx.exception.args[0])
-
-    def test_create_with_ingest_percentage_not_numeric(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
-
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={
-                "bulk-size": 5000,
-                "ingest-percentage": "100 percent"
-            })
-
-        self.assertEqual("'ingest-percentage' must be numeric", ctx.exception.args[0])
+        self._assert_invalid({"data-streams": ["test-data-stream-1", "test-data-stream-2"], "conflicts": "sequential"},
+                             "'conflicts' cannot be used with 'data-streams'")
 
     def test_create_valid_param_source(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
-
-        self.assertIsNotNone(params.BulkIndexParamSource(workload.Workload(name="unit-test", corpora=[corpus]), params={
+        self.assertIsNotNone(params.BulkIndexParamSource(self.default_workload, params={
             "conflicts": "random",
             "bulk-size": 5000,
             "batch-size": 20000,
@@ -916,22 +912,7 @@ class BulkIndexParamSourceTests(TestCase):
         }))
 
     def test_passes_all_corpora_by_default(self):
-        corpora = [
-            workload.DocumentCorpus(name="default", documents=[
-                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                number_of_documents=10,
-                                target_index="test-idx",
-                                target_type="test-type"
-                                )
-            ]),
-            workload.DocumentCorpus(name="special", documents=[
-                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                number_of_documents=100,
-                                target_index="test-idx2",
-                                target_type="type"
-                                )
-            ]),
-        ]
+        corpora = _make_two_corpora(10, 100)
 
         source = params.BulkIndexParamSource(
             workload=workload.Workload(name="unit-test", corpora=corpora),
@@ -946,22 +927,7 @@ class BulkIndexParamSourceTests(TestCase):
         self.assertEqual(partition.corpora, corpora)
 
     def test_filters_corpora(self):
-        corpora = [
-            workload.DocumentCorpus(name="default", documents=[
-                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                number_of_documents=10,
-                                target_index="test-idx",
-                                target_type="test-type"
-                                )
-            ]),
-            workload.DocumentCorpus(name="special", documents=[
-                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                number_of_documents=100,
-                                target_index="test-idx2",
-                                target_type="type"
-                                )
-            ]),
-        ]
+        corpora = _make_two_corpora(10, 100)
 
         source = params.BulkIndexParamSource(
             workload=workload.Workload(name="unit-test", corpora=corpora),
@@ -1012,16 +978,9 @@ class BulkIndexParamSourceTests(TestCase):
         self.assertEqual(partition.corpora, [corpora[0], corpora[2]])
 
     def test_raises_exception_if_no_corpus_matches(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
-
         with self.assertRaises(exceptions.BenchmarkAssertionError) as ctx:
             params.BulkIndexParamSource(
-                workload=workload.Workload(name="unit-test", corpora=[corpus]),
+                workload=self.default_workload,
                 params={
                     "corpora": "does_not_exist",
                     "conflicts": "random",
@@ -1033,27 +992,14 @@ class BulkIndexParamSourceTests(TestCase):
         self.assertEqual("The provided corpus ['does_not_exist'] does not match any of the corpora ['default'].", ctx.exception.args[0])
 
     def test_ingests_all_documents_by_default(self):
-        corpora = [
-            workload.DocumentCorpus(name="default", documents=[
-                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                number_of_documents=300000,
-                                target_index="test-idx",
-                                target_type="test-type"
-                                )
-            ]),
-            workload.DocumentCorpus(name="special", documents=[
-                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                number_of_documents=700000,
-                                target_index="test-idx2",
-                                target_type="type"
-                                )
-            ]),
-        ]
+        corpora = _make_two_corpora(300000, 700000)
 
         source = params.BulkIndexParamSource(
             workload=workload.Workload(name="unit-test", corpora=corpora),
             params={
-                "bulk-size": 10000
+                "bulk-size": 10000,
+                # only the number of documents matters; never read any data
+                "__create_reader": lambda *args: StaticBulkReader("test-idx", "test-type", bulks=[])
             })
 
         partition = source.partition(0, 1)
@@ -1083,22 +1029,7 @@ class BulkIndexParamSourceTests(TestCase):
                 except StopIteration:
                     return
 
-        corpora = [
-            workload.DocumentCorpus(name="default", documents=[
-                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                number_of_documents=300000,
-                                target_index="test-idx",
-                                target_type="test-type"
-                                )
-            ]),
-            workload.DocumentCorpus(name="special", documents=[
-                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                number_of_documents=700000,
-                                target_index="test-idx2",
-                                target_type="type"
-                                )
-            ]),
-        ]
+        corpora = _make_two_corpora(300000, 700000)
 
         source = params.BulkIndexParamSource(
             workload=workload.Workload(name="unit-test", corpora=corpora),
@@ -1115,51 +1046,65 @@ class BulkIndexParamSourceTests(TestCase):
         self.assertEqual(3, len(list(schedule(partition))))
 
     def test_create_with_conflict_probability_zero(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )])
-
-        params.BulkIndexParamSource(workload=workload.Workload(name="unit-test", corpora=[corpus]), params={
+        params.BulkIndexParamSource(workload=self.default_workload, params={
             "bulk-size": 5000,
             "conflicts": "sequential",
             "conflict-probability": 0
         })
 
     def test_create_with_conflict_probability_too_low(self):
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test"), params={
-                "bulk-size": 5000,
-                "conflicts": "sequential",
-                "conflict-probability": -0.1
-            })
-
-        self.assertEqual("'conflict-probability' must be in the range [0.0, 100.0] but was -0.1", ctx.exception.args[0])
+        self._assert_invalid({"bulk-size": 5000, "conflicts": "sequential", "conflict-probability": -0.1},
+                             "'conflict-probability' must be in the range [0.0, 100.0] but was -0.1")
 
     def test_create_with_conflict_probability_too_high(self):
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test"), params={
-                "bulk-size": 5000,
-                "conflicts": "sequential",
-                "conflict-probability": 100.1
-            })
-
-        self.assertEqual("'conflict-probability' must be in the range [0.0, 100.0] but was 100.1", ctx.exception.args[0])
+        self._assert_invalid({"bulk-size": 5000, "conflicts": "sequential", "conflict-probability": 100.1},
+                             "'conflict-probability' must be in the range [0.0, 100.0] but was 100.1")
 
     def test_create_with_conflict_probability_not_numeric(self):
-        with self.assertRaises(exceptions.InvalidSyntax) as ctx:
-            params.BulkIndexParamSource(workload=workload.Workload(name="unit-test"), params={
-                "bulk-size": 5000,
-                "conflicts": "sequential",
-                "conflict-probability": "100 percent"
-            })
+        self._assert_invalid({"bulk-size": 5000, "conflicts": "sequential", "conflict-probability": "100 percent"},
+                             "'conflict-probability' must be numeric")
+
 
-        self.assertEqual("'conflict-probability' must be numeric", ctx.exception.args[0])
+# keys that are identical in all bulks generated with the same original parameters
+_EXPECTED_BULK_BASE = {
+    "action-metadata-present": True,
+    "unit": "docs",
+    "my-custom-parameter": "foo",
+    "my-custom-parameter-2": True
+}
 
 
 class BulkDataGeneratorTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.default_corpus = workload.DocumentCorpus(name="default", documents=[
+            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
+                               number_of_documents=10,
+                               target_index="test-idx",
+                               target_type="test-type"
+                               )
+        ])
+        cls.multi_corpora = [
+            workload.DocumentCorpus(name="default", documents=[
+                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
+                                   number_of_documents=5,
+                                   target_index="logs-2018-01",
+                                   target_type="docs"
+                                   ),
+                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
+                                   number_of_documents=5,
+                                   target_index="logs-2018-02",
+                                   target_type="docs"
+                                   ),
+            ]),
+            workload.DocumentCorpus(name="special", documents=[
+                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
+                                   number_of_documents=5,
+                                   target_index="logs-2017-01",
+                                   target_type="docs"
+                                   )
+            ]),
+        ]
 
     @classmethod
     def create_test_reader(cls, batches):
@@ -1169,15 +1114,7 @@ class BulkDataGeneratorTests(TestCase):
         return inner_create_test_reader
 
     def test_generate_two_bulks(self):
-        corpus = workload.DocumentCorpus(name="default", documents=[
-            workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                            number_of_documents=10,
-                            target_index="test-idx",
-                            target_type="test-type"
-                            )
-        ])
-
-        bulks = params.bulk_data_based(num_clients=1, start_client_index=0, end_client_index=0, corpora=[corpus],
+        bulks = params.bulk_data_based(num_clients=1, start_client_index=0, end_client_index=0, corpora=[self.default_corpus],
                                        batch_size=5, bulk_size=5,
                                        id_conflicts=params.IndexIdConflict.NoConflicts, conflict_probability=None, on_conflict=None,
                                        recency=None, pipeline=None,
@@ -1186,56 +1123,16 @@ class BulkDataGeneratorTests(TestCase):
                                            "my-custom-parameter-2": True
                                        }, create_reader=BulkDataGeneratorTests.
                                        create_test_reader([["1", "2", "3", "4", "5"], ["6", "7", "8"]]))
-        all_bulks = list(bulks)
-        self.assertEqual(2, len(all_bulks))
-        self.assertEqual({
-            "action-metadata-present": True,
-            "body": ["1", "2", "3", "4", "5"],
-            "bulk-size": 5,
-            "unit": "docs",
-            "index": "test-idx",
-            "type": "test-type",
-            "my-custom-parameter": "foo",
-            "my-custom-parameter-2": True
-        }, all_bulks[0])
+        bulk_iter = iter(bulks)
+        self.assertEqual({**_EXPECTED_BULK_BASE, "body": ["1", "2", "3", "4", "5"], "bulk-size": 5, "index": "test-idx", "type": "test-type"},
+                         next(bulk_iter))
 
-        self.assertEqual({
-            "action-metadata-present": True,
-            "body": ["6", "7", "8"],
-            "bulk-size": 3,
-            "unit": "docs",
-            "index": "test-idx",
-            "type": "test-type",
-            "my-custom-parameter": "foo",
-            "my-custom-parameter-2": True
-        }, all_bulks[1])
+        self.assertEqual({**_EXPECTED_BULK_BASE, "body": ["6", "7", "8"], "bulk-size": 3, "index": "test-idx", "type": "test-type"},
+                         next(bulk_iter))
+        self.assertRaises(StopIteration, next, bulk_iter)
 
     def test_generate_bulks_from_multiple_corpora(self):
-        corpora = [
-            workload.DocumentCorpus(name="default", documents=[
-                        workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                        number_of_documents=5,
-                                        target_index="logs-2018-01",
-                                        target_type="docs"
-                                        ),
-                        workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                        number_of_documents=5,
-                                        target_index="logs-2018-02",
-                                        target_type="docs"
-                                        ),
-
-                    ]),
-            workload.DocumentCorpus(name="special", documents=[
-                workload.Documents(source_format=workload.Documents.SOURCE_FORMAT_BULK,
-                                number_of_documents=5,
-                                target_index="logs-2017-01",
-                                target_type="docs"
-                                )
-            ])
-
-            ]
-
-        bulks = params.bulk_data_based(num_clients=1, start_client_index=0, end_client_index=0, corpora=corpora,
+        bulks = params.bulk_data_based(num_clients=1, start_client_index=0, end_client_index=0, corpora=self.multi_corpora,
                                        batch_size=5, bulk_size=5,
                                        id_conflicts=params.IndexIdConflict.NoConflicts, conflict_probability=None, on_conflict=None,
                                        recency=None, pipeline=None,
@@ -1244,40 +1141,16 @@ class BulkDataGeneratorTests(TestCase):
                                            "my-custom-parameter-2": True
                                        }, create_reader=BulkDataGeneratorTests.
                                        create_test_reader([["1", "2", "3", "4", "5"]]))
-        all_bulks = list(bulks)
-        self.assertEqual(3, len(all_bulks))
-        self.assertEqual({
-            "action-metadata-present": True,
-            "body": ["1", "2", "3", "4", "5"],
-            "bulk-size": 5,
-            "unit": "docs",
-            "index": "logs-2018-01",
-            "type": "docs",
-            "my-custom-parameter": "foo",
-            "my-custom-parameter-2": True
-        }, all_bulks[0])
+        bulk_iter = iter(bulks)
+        self.assertEqual({**_EXPECTED_BULK_BASE, "body": ["1", "2", "3", "4", "5"], "bulk-size": 5, "index": "logs-2018-01", "type": "docs"},
+                         next(bulk_iter))
 
-        self.assertEqual({
-            "action-metadata-present": True,
-            "body": ["1", "2", "3", "4", "5"],
-            "bulk-size": 5,
-            "unit": "docs",
-            "index": "logs-2018-02",
-            "type": "docs",
-            "my-custom-parameter": "foo",
-            "my-custom-parameter-2": True
-        }, all_bulks[1])
+        self.assertEqual({**_EXPECTED_BULK_BASE, "body": ["1", "2", "3", "4", "5"], "bulk-size": 5, "index": "logs-2018-02", "type": "docs"},
+                         next(bulk_iter))
 
-        self.assertEqual({
-            "action-metadata-present": True,
-            "body": ["1", "2", "3", "4", "5"],
-            "bulk-size": 5,
-            "unit": "docs",
-            "index": "logs-2017-01",
-            "type": "docs",
-            "my-custom-parameter": "foo",
-            "my-custom-parameter-2": True
-        }, all_bulks[2])
+        self.assertEqual({**_EXPECTED_BULK_BASE, "body": ["1", "2", "3", "4", "5"], "bulk-size": 5, "index": "logs-2017-01", "type": "docs"},
+                         next(bulk_iter))
+        self.assertRaises(StopIteration, next, bulk_iter)
 
     def test_internal_params_take_precedence(self):
         corpus = workload.DocumentCorpus(name="default", documents=[
@@ -2575,7 +2448,7 @@ class ForceMergeParamSourceTests(TestCase):
         self.assertEqual("polling", p["mode"])
 
 
-class VectorSearchParamSourceTests(TestCase):
+class VectorSearchParamSourceTests(SharedDataSetDirMixin, TestCase):
     DEFAULT_INDEX_NAME = "test-index"
     DEFAULT_FIELD_NAME = "test-field"
     DEFAULT_CONTEXT = Context.INDEX
@@ -2584,18 +2457,21 @@ class VectorSearchParamSourceTests(TestCase):
     DEFAULT_DIMENSION = 10
     DEFAULT_RANDOM_STRING_LENGTH = 8
 
-    def setUp(self) -> None:
-        self.data_set_dir = tempfile.mkdtemp()
-
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
         # Create a data set we know to be valid for convenience
-        self.valid_data_set_path = create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            self.DEFAULT_CONTEXT,
-            self.data_set_dir
+        cls.valid_data_set_path = create_data_set(
+            cls.DEFAULT_NUM_VECTORS,
+            cls.DEFAULT_DIMENSION,
+            cls.DEFAULT_TYPE,
+            cls.DEFAULT_CONTEXT,
+            cls.shared_data_set_dir
         )
 
+    def setUp(self) -> None:
+        self.data_set_dir = tempfile.mkdtemp()
+
     def tearDown(self):
         shutil.rmtree(self.data_set_dir)
 
@@ -2867,7 +2743,7 @@ class VectorSearchParamSourceTests(TestCase):
             pass
 
 
-class VectorSearchPartitionPartitionParamSourceTestCase(TestCase):
+class VectorSearchPartitionPartitionParamSourceTestCase(SharedDataSetDirMixin, TestCase):
 
     DEFAULT_INDEX_NAME = "test-partition-index"
     DEFAULT_FIELD_NAME = "test-vector-field"
@@ -2877,257 +2753,78 @@ class VectorSearchPartitionPartitionParamSourceTestCase(TestCase):
     DEFAULT_DIMENSION = 10
     DEFAULT_RANDOM_STRING_LENGTH = 8
 
-    def setUp(self) -> None:
-        self.data_set_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        shutil.rmtree(self.data_set_dir)
-
-    def test_params_default(self):
-        # Create a data set
-        k = 12
-        data_set_path = create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.QUERY,
-            self.data_set_dir
-        )
-        create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.NEIGHBORS,
-            self.data_set_dir,
-            data_set_path
-        )
-
-        # Create a QueryVectorsFromDataSetParamSource with relevant params
-        test_param_source_params = {
-            "field": self.DEFAULT_FIELD_NAME,
-            "data_set_format": self.DEFAULT_TYPE,
-            "data_set_path": data_set_path,
-            "k": k
+    POST_FILTER_BODY = {"range": {"price": {"gte": 5, "lte": 10}}}
+    BOOL_FILTER_BODY = {
+        "bool": {
+            "must": [
+                {"range": {"rating": {"gte": 8, "lte": 10}}},
+                {"term": {"parking": "true"}},
+            ]
         }
-        query_param_source = VectorSearchPartitionParamSource(
-            workload.Workload(name="unit-test"),
-            test_param_source_params, {
-                "index": self.DEFAULT_INDEX_NAME,
-                "request-params": {},
-            }
-        )
-        query_param_source_partition = query_param_source.partition(0, 1)
-
-        # Check each
-        for _ in range(DEFAULT_NUM_VECTORS):
-            self._check_params(
-                query_param_source_partition.params(),
-                self.DEFAULT_FIELD_NAME,
-                self.DEFAULT_DIMENSION,
-                k,
-            )
+    }
 
-        # Assert last call creates stop iteration
-        with self.assertRaises(StopIteration):
-            query_param_source_partition.params()
-
-    def test_post_filter(self):
-        # Create a data set
-        k = 12
-        data_set_path = create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.QUERY,
-            self.data_set_dir
-        )
-        neighbors_data_set_path = create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.NEIGHBORS,
-            self.data_set_dir,
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.data_set_path = create_query_and_neighbors_data_set(
+            cls.DEFAULT_NUM_VECTORS,
+            cls.DEFAULT_DIMENSION,
+            cls.shared_data_set_dir
         )
 
-        # Create a QueryVectorsFromDataSetParamSource with relevant params
-
-        POST_FILTER_BODY = {"range": {"price": {"gte": 5, "lte": 10}}}
-        test_param_source_params = {
-            "field": self.DEFAULT_FIELD_NAME,
-            "data_set_format": self.DEFAULT_TYPE,
-            "data_set_path": data_set_path,
-            "neighbors_data_set_path": neighbors_data_set_path,
-            "k": k,
-            "filter_type": "post_filter",
-            "filter_body": POST_FILTER_BODY,
-        }
-        query_param_source = VectorSearchPartitionParamSource(
-            workload.Workload(name="unit-test"),
-            test_param_source_params,
-            {
-                "index": self.DEFAULT_INDEX_NAME,
-                "request-params": {},
-                "body": {
-                    "size": 100,
-                },
-            },
-        )
-        query_param_source_partition = query_param_source.partition(0, 1)
+    def test_params(self):
+        k = 12
+        size = 100
 
-        # Check each
-        for _ in range(DEFAULT_NUM_VECTORS):
-            params = query_param_source_partition.params()
-            self._check_params(
-                params,
-                self.DEFAULT_FIELD_NAME,
-                self.DEFAULT_DIMENSION,
-                k,
-                100,
-            )
+        def check_post_filter(params):
+            self._check_params(params, self.DEFAULT_FIELD_NAME, self.DEFAULT_DIMENSION, k, size)
             post_filter = params.get("body").get("post_filter")
             self.assertIsInstance(post_filter, dict)
-            self.assertEqual(post_filter, POST_FILTER_BODY)
-
-        # Assert last call creates stop iteration
-        with self.assertRaises(StopIteration):
-            query_param_source_partition.params()
-
-    def test_bool_filter(self):
-        # Create a data set
-        k = 12
-        data_set_path = create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.QUERY,
-            self.data_set_dir,
-        )
-        neighbors_data_set_path = create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.NEIGHBORS,
-            self.data_set_dir,
-        )
-        # Create a QueryVectorsFromDataSetParamSource with relevant params
-
-        BOOL_FILTER_BODY = {
-            "bool": {
-                "must": [
-                    {"range": {"rating": {"gte": 8, "lte": 10}}},
-                    {"term": {"parking": "true"}},
-                ]
-            }
-        }
-        test_param_source_params = {
-            "field": self.DEFAULT_FIELD_NAME,
-            "data_set_format": self.DEFAULT_TYPE,
-            "data_set_path": data_set_path,
-            "neighbors_data_set_path": neighbors_data_set_path,
-            "k": k,
-            "filter_type": "boolean",
-            "filter_body": BOOL_FILTER_BODY,
-        }
-        query_param_source = VectorSearchPartitionParamSource(
-            workload.Workload(name="unit-test"),
-            test_param_source_params,
-            {
-                "index": self.DEFAULT_INDEX_NAME,
-                "request-params": {},
-                "body": {
-                    "size": 100,
-                },
-            },
-        )
-        query_param_source_partition = query_param_source.partition(0, 1)
-
-        # Check each
-        for _ in range(DEFAULT_NUM_VECTORS):
-            params = query_param_source_partition.params()
-            self._check_params_bool(
-                params,
-                self.DEFAULT_FIELD_NAME,
-                self.DEFAULT_DIMENSION,
-                k,
-                100,
-                BOOL_FILTER_BODY,
-            )
-            # post_filter = params.get("body").get("post_filter")
-            # self.assertIsInstance(post_filter, dict)
-            # self.assertEqual(post_filter, BOOL_FILTER_BODY)
-
-        # Assert last call creates stop iteration
-        with self.assertRaises(StopIteration):
-            query_param_source_partition.params()
-
-    def test_script_score_filter(self):
-        # Create a data set
-        k = 12
-        data_set_path = create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.QUERY,
-            self.data_set_dir,
-        )
-        neighbors_data_set_path = create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.NEIGHBORS,
-            self.data_set_dir,
-        )
-
-        # Create a QueryVectorsFromDataSetParamSource with relevant params
-
-        SCRIPT_SCORE_FILTER_BODY = {
-            "bool": {
-                "must": [
-                    {"range": {"rating": {"gte": 8, "lte": 10}}},
-                    {"term": {"parking": "true"}},
-                ]
-            }
-        }
-        test_param_source_params = {
-            "field": self.DEFAULT_FIELD_NAME,
-            "data_set_format": self.DEFAULT_TYPE,
-            "data_set_path": data_set_path,
-            "neighbors_data_set_path": neighbors_data_set_path,
-            "k": k,
-            "filter_type": "script",
-            "filter_body": SCRIPT_SCORE_FILTER_BODY,
-        }
-        query_param_source = VectorSearchPartitionParamSource(
-            workload.Workload(name="unit-test"),
-            test_param_source_params,
-            {
-                "index": self.DEFAULT_INDEX_NAME,
-                "request-params": {},
-                "body": {
-                    "size": 100,
-                },
-            },
-        )
-        query_param_source_partition = query_param_source.partition(0, 1)
-
-        # Check each
-        for _ in range(DEFAULT_NUM_VECTORS):
-            params = query_param_source_partition.params()
-            self._check_params_script_score(
-                params,
-                self.DEFAULT_FIELD_NAME,
-                self.DEFAULT_DIMENSION,
-                k,
-                100,
-                SCRIPT_SCORE_FILTER_BODY,
-            )
-            # post_filter = params.get("body").get("post_filter")
-            # self.assertIsInstance(post_filter, dict)
-            # self.assertEqual(post_filter, BOOL_FILTER_BODY)
-
-        # Assert last call creates stop iteration
-        with self.assertRaises(StopIteration):
-            query_param_source_partition.params()
+            self.assertEqual(post_filter, self.POST_FILTER_BODY)
+
+        # (filter type, filter body, query body, check for each returned parameter)
+        cases = [
+            (None, None, None,
+             lambda params: self._check_params(params, self.DEFAULT_FIELD_NAME, self.DEFAULT_DIMENSION, k)),
+            ("post_filter", self.POST_FILTER_BODY, {"size": size}, check_post_filter),
+            ("boolean", self.BOOL_FILTER_BODY, {"size": size},
+             lambda params: self._check_params_bool(
+                 params, self.DEFAULT_FIELD_NAME, self.DEFAULT_DIMENSION, k, size, self.BOOL_FILTER_BODY)),
+            ("script", self.BOOL_FILTER_BODY, {"size": size},
+             lambda params: self._check_params_script_score(
+                 params, self.DEFAULT_FIELD_NAME, self.DEFAULT_DIMENSION, k, size, self.BOOL_FILTER_BODY)),
+        ]
+        for filter_type, filter_body, query_body, check in cases:
+            with self.subTest(filter_type=filter_type):
+                test_param_source_params = {
+                    "field": self.DEFAULT_FIELD_NAME,
+                    "data_set_format": self.DEFAULT_TYPE,
+                    "data_set_path": self.data_set_path,
+                    "k": k,
+                }
+                query_params = {
+                    "index": self.DEFAULT_INDEX_NAME,
+                    "request-params": {},
+                }
+                if filter_type:
+                    test_param_source_params.update({
+                        "neighbors_data_set_path": self.data_set_path,
+                        "filter_type": filter_type,
+                        "filter_body": filter_body,
+                    })
+                if query_body:
+                    query_params["body"] = query_body
+                query_param_source = VectorSearchPartitionParamSource(
+                    workload.Workload(name="unit-test"), test_param_source_params, query_params)
+                query_param_source_partition = query_param_source.partition(0, 1)
+
+                # Check each
+                for _ in range(DEFAULT_NUM_VECTORS):
+                    check(query_param_source_partition.params())
+
+                # Assert last call creates stop iteration
+                with self.assertRaises(StopIteration):
+                    query_param_source_partition.params()
 
     def _check_params(
             self,
@@ -3148,7 +2845,7 @@ class VectorSearchPartitionPartitionParamSourceTestCase(TestCase):
         self.assertIsInstance(field, dict)
         vector = field.get("vector")
         self.assertIsInstance(vector, np.ndarray)
-        self.assertEqual(len(list(vector)), expected_dimension)
+        self.assertEqual((expected_dimension,), vector.shape)
         k = field.get("k")
         self.assertEqual(k, expected_k)
         neighbor = actual_params.get("neighbors")
@@ -3226,12 +2923,12 @@ class VectorSearchPartitionPartitionParamSourceTestCase(TestCase):
 
         vector = params.get("query_value")
         self.assertIsInstance(vector, np.ndarray)
-        self.assertEqual(len(list(vector)), expected_dimension)
+        self.assertEqual((expected_dimension,), vector.shape)
 
         space_type = params.get("space_type")
         self.assertEqual(space_type, "l2") # TODO change this once it's all modifiable.
 
-class BulkVectorsFromDataSetParamSourceTestCase(TestCase):
+class BulkVectorsFromDataSetParamSourceTestCase(SharedDataSetDirMixin, TestCase):
 
     DEFAULT_INDEX_NAME = "test-partition-index"
     DEFAULT_VECTOR_FIELD_NAME = "test-vector-field"
@@ -3241,23 +2938,23 @@ class BulkVectorsFromDataSetParamSourceTestCase(TestCase):
     DEFAULT_DIMENSION = 10
     DEFAULT_RANDOM_STRING_LENGTH = 8
     DEFAULT_ID_FIELD_NAME = "_id"
+    BULK_NUM_VECTORS = 49
 
-    def setUp(self) -> None:
-        self.data_set_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        shutil.rmtree(self.data_set_dir)
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.data_set_path = create_data_set(
+            cls.BULK_NUM_VECTORS,
+            cls.DEFAULT_DIMENSION,
+            cls.DEFAULT_TYPE,
+            Context.INDEX,
+            cls.shared_data_set_dir
+        )
 
     def test_params_default(self):
-        num_vectors = 49
+        num_vectors = self.BULK_NUM_VECTORS
         bulk_size = 10
-        data_set_path = create_data_set(
-            num_vectors,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.INDEX,
-            self.data_set_dir
-        )
+        data_set_path = self.data_set_path
 
         test_param_source_params = {
             "index": self.DEFAULT_INDEX_NAME,
@@ -3290,15 +2987,9 @@ class BulkVectorsFromDataSetParamSourceTestCase(TestCase):
             bulk_param_source_partition.params()
 
     def test_params_custom(self):
-        num_vectors = 49
+        num_vectors = self.BULK_NUM_VECTORS
         bulk_size = 10
-        data_set_path = create_data_set(
-            num_vectors,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.INDEX,
-            self.data_set_dir
-        )
+        data_set_path = self.data_set_path
 
         test_param_source_params = {
             "index": self.DEFAULT_INDEX_NAME,
@@ -3348,21 +3039,23 @@ class BulkVectorsFromDataSetParamSourceTestCase(TestCase):
         # Bulk payload has 2 parts: first one is the header and the second one
         # is the body. The header will have the index name and the body will
         # have the vector
-        for header, req_body in zip(*[iter(body)] * 2):
-            index = header.get("index")
+        headers, req_bodies = body[0::2], body[1::2]
+        indices = [header.get("index") for header in headers]
+        for index in indices:
             self.assertIsInstance(index, dict)
+        self.assertEqual([expected_index] * len(indices), [index.get("_index") for index in indices])
 
-            index_name = index.get("_index")
-            self.assertEqual(index_name, expected_index)
+        vectors = [req_body.get(expected_vector_field) for req_body in req_bodies]
+        self.assertTrue(all(isinstance(vector, list) for vector in vectors))
+        self.assertEqual((expected_num_vectors_in_payload, expected_dimension), np.asarray(vectors).shape)
 
-            vector = req_body.get(expected_vector_field)
-            self.assertIsInstance(vector, list)
-            self.assertEqual(len(vector), expected_dimension)
+        # the id is either part of the action meta-data or of the document
+        for index, req_body in zip(indices, req_bodies):
             if expected_id_field in index:
                 self.assertEqual(self.DEFAULT_ID_FIELD_NAME, expected_id_field)
-                self.assertFalse(expected_id_field in req_body)
-                continue
-            self.assertTrue(expected_id_field in req_body)
+                self.assertNotIn(expected_id_field, req_body)
+            else:
+                self.assertIn(expected_id_field, req_body)
 
 
 class BulkVectorsAttributeCase(TestCase):
@@ -3453,27 +3146,28 @@ class BulkVectorsAttributeCase(TestCase):
         # Bulk payload has 2 parts: first one is the header and the second one
         # is the body. The header will have the index name and the body will
         # have the vector
-        for header, req_body in zip(*[iter(body)] * 2):
-            index = header.get("index")
+        headers, req_bodies = body[0::2], body[1::2]
+        indices = [header.get("index") for header in headers]
+        for index in indices:
             self.assertIsInstance(index, dict)
+        self.assertEqual([expected_index] * len(indices), [index.get("_index") for index in indices])
 
-            index_name = index.get("_index")
-            self.assertEqual(index_name, expected_index)
-
-            vector = req_body.get(expected_vector_field)
-            self.assertIsInstance(vector, list)
-            self.assertEqual(len(vector), expected_dimension)
+        vectors = [req_body.get(expected_vector_field) for req_body in req_bodies]
+        self.assertTrue(all(isinstance(vector, list) for vector in vectors))
+        self.assertEqual((expected_num_vectors_in_payload, expected_dimension), np.asarray(vectors).shape)
+        for attribute in self.ATTRIBUTES_LIST:
+            self.assertTrue(all(attribute in req_body for req_body in req_bodies))
 
-            for attribute in self.ATTRIBUTES_LIST:
-                self.assertTrue(attribute in req_body)
+        # the id is either part of the action meta-data or of the document
+        for index, req_body in zip(indices, req_bodies):
             if expected_id_field in index:
                 self.assertEqual(self.DEFAULT_ID_FIELD_NAME, expected_id_field)
-                self.assertFalse(expected_id_field in req_body)
-                continue
-            self.assertTrue(expected_id_field in req_body)
+                self.assertNotIn(expected_id_field, req_body)
+            else:
+                self.assertIn(expected_id_field, req_body)
 
 
-class VectorsNestedCase(TestCase):
+class VectorsNestedCase(SharedDataSetDirMixin, TestCase):
     DEFAULT_INDEX_NAME = "test-partition-index"
     DEFAULT_VECTOR_FIELD_NAME = "nested.test-vector-field"
     DEFAULT_CONTEXT = Context.INDEX
@@ -3482,14 +3176,29 @@ class VectorsNestedCase(TestCase):
     DEFAULT_DIMENSION = 10
     DEFAULT_RANDOM_STRING_LENGTH = 8
     DEFAULT_ID_FIELD_NAME = "_id"
+    BULK_NUM_VECTORS = 49
 
-    def setUp(self) -> None:
-        self.data_set_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        shutil.rmtree(self.data_set_dir)
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.data_set_path = create_data_set(
+            cls.BULK_NUM_VECTORS,
+            cls.DEFAULT_DIMENSION,
+            cls.DEFAULT_TYPE,
+            Context.INDEX,
+            cls.shared_data_set_dir
+        )
+        cls.parent_data_set_path = create_parent_data_set(
+            cls.BULK_NUM_VECTORS,
+            cls.DEFAULT_DIMENSION,
+            cls.DEFAULT_TYPE,
+            Context.PARENTS,
+            cls.shared_data_set_dir
+        )
 
-    def test_invalid_nesting_scheme(self):
+    # the data set is only opened when the param source is partitioned, so "path" never needs to exist
+    @mock.patch("osbenchmark.workload.params.get_data_set")
+    def test_invalid_nesting_scheme(self, get_data_set):
         # Test with 0 "." in the vector field, with 2 "." in the vector field, and with a different separator.
         invalid_nesting_schemes = ["a", "a.b.c", "a.b.c.d"]
         for nesting_scheme in invalid_nesting_schemes:
@@ -3508,6 +3217,8 @@ class VectorsNestedCase(TestCase):
                 with self.assertRaises(ValueError):
                     bulk_param_source.get_split_fields()
 
+        get_data_set.assert_not_called()
+
     def _test_params_default(
         self, bulk_size, data_set_path, parent_data_set_path, num_vectors
     ):
@@ -3550,47 +3261,17 @@ class VectorsNestedCase(TestCase):
 
         bulk_sizes = [1, 3, 4, 10, 50]
 
-        num_vectors = 49
-        # bulk_size = 10
-        data_set_path = create_data_set(
-            num_vectors,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.INDEX,
-            self.data_set_dir,
-        )
-        parent_data_set_path = create_parent_data_set(
-            num_vectors,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.PARENTS,
-            self.data_set_dir,
-        )
-
         for bulk_size in bulk_sizes:
             with self.subTest(bulk_size=bulk_size):
                 self._test_params_default(
-                    bulk_size, data_set_path, parent_data_set_path, num_vectors
+                    bulk_size, self.data_set_path, self.parent_data_set_path, self.BULK_NUM_VECTORS
                 )
 
     def test_params_custom(self):
-        num_vectors = 49
+        num_vectors = self.BULK_NUM_VECTORS
         bulk_size = 15
-        data_set_path = create_data_set(
-            num_vectors,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.INDEX,
-            self.data_set_dir,
-        )
-
-        parent_data_set_path = create_parent_data_set(
-            num_vectors,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.PARENTS,
-            self.data_set_dir,
-        )
+        data_set_path = self.data_set_path
+        parent_data_set_path = self.parent_data_set_path
 
         test_param_source_params = {
             "index": self.DEFAULT_INDEX_NAME,
@@ -3633,20 +3314,10 @@ class VectorsNestedCase(TestCase):
 
     def test_build_vector_search_query_body(self):
         k = 12
-        data_set_path = create_data_set(
+        data_set_path = create_query_and_neighbors_data_set(
             self.DEFAULT_NUM_VECTORS,
             self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.QUERY,
-            self.data_set_dir
-        )
-        create_data_set(
-            self.DEFAULT_NUM_VECTORS,
-            self.DEFAULT_DIMENSION,
-            self.DEFAULT_TYPE,
-            Context.NEIGHBORS,
-            self.data_set_dir,
-            data_set_path
+            self.shared_data_set_dir
         )
 
         # Create a QueryVectorsFromDataSetParamSource with relevant params
@@ -3664,14 +3335,17 @@ class VectorsNestedCase(TestCase):
             }
         )
         query_param_source_partition = query_param_source.partition(0, 1)
+        with h5py.File(data_set_path, "r") as hf:
+            expected_vectors = hf[HDF5DataSet.parse_context(Context.QUERY)][()]
 
         # Check each
-        for _ in range(DEFAULT_NUM_VECTORS):
+        for expected_vector in expected_vectors:
             self._check_query_params(
                 query_param_source_partition.params(),
                 self.DEFAULT_VECTOR_FIELD_NAME,
                 self.DEFAULT_DIMENSION,
                 k,
+                expected_vector=expected_vector,
             )
 
         # Assert last call creates stop iteration
@@ -3686,6 +3360,7 @@ class VectorsNestedCase(TestCase):
             expected_k: int,
             expected_size=None,
             expected_filter=None,
+            expected_vector=None,
     ):
         body = actual_params.get("body")
         self.assertIsInstance(body, dict)
@@ -3705,7 +3380,10 @@ class VectorsNestedCase(TestCase):
         self.assertIsInstance(field, dict)
         vector = field.get("vector")
         self.assertIsInstance(vector, np.ndarray)
-        self.assertEqual(len(list(vector)), expected_dimension)
+        self.assertEqual(np.float32, vector.dtype)
+        self.assertEqual((expected_dimension,), vector.shape)
+        if expected_vector is not None:
+            np.testing.assert_array_equal(expected_vector, vector)
         k = field.get("k")
         self.assertEqual(k, expected_k)
         neighbor = actual_params.get("neighbors")
@@ -3731,24 +3409,22 @@ class VectorsNestedCase(TestCase):
         self.assertIsInstance(body, list)
         self.assertEqual(len(body) // 2, expected_num_docs_in_payload)
 
+        outer, inner = expected_vector_field.split(".")
         # Bulk payload has 2 parts: first one is the header and the second one
         # is the body. The header will have the index name and the body will
         # have the vector
-        for header, req_body in zip(*[iter(body)] * 2):
+        for header, req_body in zip(body[0::2], body[1::2]):
             index = header.get("index")
             self.assertIsInstance(index, dict)
 
             index_name = index.get("_index")
             self.assertEqual(index_name, expected_index)
-            # here, need to iterate over all of the nested fields.
-            outer, inner = expected_vector_field.split(".")
+            # here, need to check all of the nested fields.
             vector_list = req_body.get(outer)
             self.assertIsInstance(vector_list, list)
-            for vec in vector_list:
-                actual_vec = vec.get(inner)
-                self.assertIsInstance(actual_vec, list)
-
-                self.assertEqual(len(actual_vec), expected_dimension)
+            actual_vectors = [vec.get(inner) for vec in vector_list]
+            self.assertTrue(all(isinstance(actual_vec, list) for actual_vec in actual_vectors))
+            self.assertEqual((len(vector_list), expected_dimension), np.asarray(actual_vectors).shape)
 
             if expected_id_field in index:
                 self.assertEqual(self.DEFAULT_ID_FIELD_NAME, expected_id_field)